@@ -11,11 +11,20 @@ Supports:
 
 from __future__ import annotations
 
+import argparse
+import asyncio
+import functools
 import getpass
+import heapq
+import math
 import os
+import random
 import re
 import sys
 import time
+from array import array
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pinecone import Pinecone, ImportErrorMode
 
 
@@ -93,24 +102,27 @@ ENV_LABELS = {
 # URI helpers
 # ---------------------------------------------------------------------------
 
+_S3_ARN_URI_RE = re.compile(r"^s3://(arn:aws:s3:[^:]*:[^:]*:accesspoint/[^/]+)(?:/(.*))?$")
+_S3_URI_RE = re.compile(r"^s3://([^/]+)(?:/(.*))?$")
+_GCS_URI_RE = re.compile(r"^gs://([^/]+)(?:/(.*))?$")
+_AZURE_URI_RE = re.compile(r"^azure://([^/]+)(?:/(.*))?$")
+_AZURE_BLOB_URL_RE = re.compile(r"^https://[^/]+\.blob\.core\.windows\.net/([^/]+)(?:/(.*))?$")
+
+
 def _parse_s3_uri(uri: str):
     """Parse s3://bucket/prefix or s3://arn:aws:s3:...:accesspoint/<name>/prefix."""
     uri = uri.rstrip("/")
-    arn_match = re.match(
-        r"^s3://(arn:aws:s3:[^:]*:[^:]*:accesspoint/[^/]+)(?:/(.*))?$", uri
-    )
-    if arn_match:
-        return arn_match.group(1), arn_match.group(2) or ""
-    std_match = re.match(r"^s3://([^/]+)(?:/(.*))?$", uri)
-    if std_match:
-        return std_match.group(1), std_match.group(2) or ""
+    match = _S3_ARN_URI_RE.match(uri) if uri.startswith("s3://arn:aws:s3:") else None
+    match = match or _S3_URI_RE.match(uri)
+    if match:
+        return match.group(1), match.group(2) or ""
     return None, None
 
 
 def _parse_gcs_uri(uri: str):
     """Parse gs://bucket/prefix."""
     uri = uri.rstrip("/")
-    match = re.match(r"^gs://([^/]+)(?:/(.*))?$", uri)
+    match = _GCS_URI_RE.match(uri)
     if match:
         return match.group(1), match.group(2) or ""
     return None, None
@@ -120,13 +132,11 @@ def _parse_azure_uri(uri: str):
     """Parse azure://container/prefix  or  https://<account>.blob.core.windows.net/container/prefix."""
     uri = uri.rstrip("/")
 
-    az_match = re.match(r"^azure://([^/]+)(?:/(.*))?$", uri)
+    az_match = _AZURE_URI_RE.match(uri)
     if az_match:
         return az_match.group(1), az_match.group(2) or ""
 
-    blob_match = re.match(
-        r"^https://[^/]+\.blob\.core\.windows\.net/([^/]+)(?:/(.*))?$", uri
-    )
+    blob_match = _AZURE_BLOB_URL_RE.match(uri)
     if blob_match:
         return blob_match.group(1), blob_match.group(2) or ""
 
@@ -154,10 +164,29 @@ def _uri_example_for_env(env: str) -> str:
 # Storage validation — S3
 # ---------------------------------------------------------------------------
 
+# Concurrent per-namespace listings when validating an S3 prefix.
+S3_LIST_WORKERS = 16
+S3_MAX_POOL_CONNECTIONS = 32
+
+@functools.lru_cache(maxsize=1)
 def _get_s3_client():
+    """Return a validated S3 client, cached for the rest of the session.
+
+    Call invalidate_s3_client() to re-resolve credentials (e.g. after they change).
+    """
     import botocore.exceptions
+    from botocore.config import Config
+
+    # One client is shared by all listing workers: size its pool above the
+    # worker count, keep connections alive, and let botocore's adaptive retry
+    # mode (jittered backoff + client-side rate limiting) absorb throttling.
+    cfg = Config(
+        max_pool_connections=max(S3_MAX_POOL_CONNECTIONS, S3_LIST_WORKERS),
+        retries={"mode": "adaptive", "max_attempts": 5},
+        tcp_keepalive=True,
+    )
     try:
-        s3 = boto3.client("s3")
+        s3 = boto3.client("s3", config=cfg)
         sts = boto3.client("sts")
         sts.get_caller_identity()
         return s3
@@ -172,12 +201,18 @@ def _get_s3_client():
     aws_region = input("    AWS Region [us-east-1]: ").strip() or "us-east-1"
     if not aws_key or not aws_secret:
         return None
-    return boto3.client(
-        "s3",
-        aws_access_key_id=aws_key,
-        aws_secret_access_key=aws_secret,
-        region_name=aws_region,
-    )
+    creds = dict(aws_access_key_id=aws_key, aws_secret_access_key=aws_secret, region_name=aws_region)
+    try:
+        # Check typed-in keys too, so a typo isn't cached for the session
+        boto3.client("sts", **creds).get_caller_identity()
+    except (botocore.exceptions.BotoCoreError, botocore.exceptions.ClientError) as e:
+        print(f"    Could not verify credentials: {e}")
+        return None
+    return boto3.client("s3", config=cfg, **creds)
+
+
+def invalidate_s3_client():
+    _get_s3_client.cache_clear()
 
 
 def validate_s3(s3_uri: str) -> bool:
@@ -197,6 +232,7 @@ def validate_s3(s3_uri: str) -> bool:
 
     s3 = _get_s3_client()
     if not s3:
+        invalidate_s3_client()  # don't cache a skipped or rejected credentials prompt
         print(f"\n  [FAIL] No valid AWS credentials provided.")
         return False
 
@@ -216,22 +252,62 @@ def validate_s3(s3_uri: str) -> bool:
     return _validate_parquet_structure_s3(s3, bucket, prefix, s3_uri)
 
 
+def _iter_s3_objects(s3, bucket, list_prefix):
+    paginator = s3.get_paginator("list_objects_v2")
+    pages = paginator.paginate(
+        Bucket=bucket, Prefix=list_prefix, PaginationConfig={"PageSize": 1000}
+    )
+    for page in pages:
+        yield from page.get("Contents", [])
+
+
+def _discover_s3_prefixes(s3, bucket, list_prefix):
+    """Return (sub-prefixes, top-level objects) directly under list_prefix."""
+    paginator = s3.get_paginator("list_objects_v2")
+    pages = paginator.paginate(
+        Bucket=bucket, Prefix=list_prefix, Delimiter="/",
+        PaginationConfig={"PageSize": 1000},
+    )
+    prefixes = []
+    top_level = []
+    for page in pages:
+        prefixes.extend(cp["Prefix"] for cp in page.get("CommonPrefixes", []))
+        top_level.extend(page.get("Contents", []))
+    return prefixes, top_level
+
+
+def _list_s3_layout_parallel(s3, bucket, list_prefix):
+    """List each namespace prefix concurrently and merge the per-prefix layouts.
+
+    A single sequential paginator is limited to one request in flight; fanning
+    out one listing per top-level prefix scales with the number of namespaces.
+    """
+    prefixes, top_level = _discover_s3_prefixes(s3, bucket, list_prefix)
+    layouts = [_classify_parquet_layout(top_level, list_prefix)]
+    if prefixes:
+        with ThreadPoolExecutor(max_workers=min(S3_LIST_WORKERS, len(prefixes))) as ex:
+            futures = [
+                ex.submit(_classify_parquet_layout,
+                          _iter_s3_objects(s3, bucket, ns_prefix), list_prefix)
+                for ns_prefix in prefixes
+            ]
+            layouts.extend(f.result() for f in futures)
+    return _merge_parquet_layouts(layouts)
+
+
 def _validate_parquet_structure_s3(s3, bucket, prefix, display_uri):
     list_prefix = f"{prefix}/" if prefix else ""
     try:
-        paginator = s3.get_paginator("list_objects_v2")
-        all_objects = []
-        for page in paginator.paginate(Bucket=bucket, Prefix=list_prefix):
-            all_objects.extend(page.get("Contents", []))
+        layout = _list_s3_layout_parallel(s3, bucket, list_prefix)
     except Exception as e:
         print(f"    [FAIL] Cannot list objects: {e}")
         return False
 
-    if not all_objects:
+    if not layout["objects"]:
         print(f"    [FAIL] No objects found under '{display_uri}'.")
         return False
 
-    return _analyze_parquet_layout(all_objects, list_prefix, "S3")
+    return _analyze_parquet_layout(layout, "S3")
 
 # ---------------------------------------------------------------------------
 # Storage validation — GCS
@@ -296,18 +372,19 @@ def validate_gcs(gcs_uri: str) -> bool:
 
     list_prefix = f"{prefix}/" if prefix else ""
     try:
-        all_objects = []
-        for blob in client.list_blobs(bucket_name, prefix=list_prefix):
-            all_objects.append({"Key": blob.name, "Size": blob.size or 0})
+        blobs = client.list_blobs(bucket_name, prefix=list_prefix)
+        layout = _classify_parquet_layout(
+            ({"Key": blob.name, "Size": blob.size or 0} for blob in blobs), list_prefix
+        )
     except Exception as e:
         print(f"    [FAIL] Cannot list objects: {e}")
         return False
 
-    if not all_objects:
+    if not layout["objects"]:
         print(f"    [FAIL] No objects found under '{gcs_uri}'.")
         return False
 
-    return _analyze_parquet_layout(all_objects, list_prefix, "GCS")
+    return _analyze_parquet_layout(layout, "GCS")
 
 # ---------------------------------------------------------------------------
 # Storage validation — Azure Blob Storage
@@ -390,30 +467,40 @@ def validate_azure(azure_uri: str) -> bool:
 
     list_prefix = f"{prefix}/" if prefix else ""
     try:
-        all_objects = []
-        for blob in container_client.list_blobs(name_starts_with=list_prefix or None):
-            all_objects.append({"Key": blob.name, "Size": blob.size or 0})
+        blobs = container_client.list_blobs(name_starts_with=list_prefix or None)
+        layout = _classify_parquet_layout(
+            ({"Key": blob.name, "Size": blob.size or 0} for blob in blobs), list_prefix
+        )
     except Exception as e:
         print(f"    [FAIL] Cannot list blobs: {e}")
         return False
 
-    if not all_objects:
+    if not layout["objects"]:
         print(f"    [FAIL] No objects found under '{azure_uri}'.")
         return False
 
-    return _analyze_parquet_layout(all_objects, list_prefix, "Azure Blob")
+    return _analyze_parquet_layout(layout, "Azure Blob")
 
 # ---------------------------------------------------------------------------
 # Shared parquet layout analysis
 # ---------------------------------------------------------------------------
 
-def _analyze_parquet_layout(all_objects: list, list_prefix: str, provider: str) -> bool:
-    """Analyze <namespace>/<file>.parquet structure and report findings."""
+def _classify_parquet_layout(objects, list_prefix: str) -> dict:
+    """Classify listed objects in a single pass, without holding the full listing.
+
+    `objects` is any iterable of {"Key", "Size"} dicts, e.g. a lazy paginator.
+    """
+    # ns -> {"files": [filename, ...], "sizes": array('d') of size_mb}
     namespaces = {}
-    non_parquet = []
+    total_files = 0
+    total_size = 0.0
+    object_count = 0
+    non_parquet_count = 0
     bad_structure = []
+    bad_structure_count = 0
 
-    for obj in all_objects:
+    for obj in objects:
+        object_count += 1
         key = obj["Key"]
         rel = key[len(list_prefix):]
         if not rel or rel.endswith("/"):
@@ -421,44 +508,79 @@ def _analyze_parquet_layout(all_objects: list, list_prefix: str, provider: str)
 
         parts = rel.split("/")
         if len(parts) == 2 and parts[1].endswith(".parquet"):
-            ns = parts[0]
-            namespaces.setdefault(ns, []).append({
-                "file": parts[1],
-                "size_mb": obj["Size"] / (1024 * 1024),
-            })
-        elif len(parts) == 1 and parts[0].endswith(".parquet"):
-            bad_structure.append(rel)
+            size_mb = obj["Size"] / (1024 * 1024)
+            entry = namespaces.get(parts[0])
+            if entry is None:
+                entry = namespaces[parts[0]] = {"files": [], "sizes": array("d")}
+            entry["files"].append(parts[1])
+            entry["sizes"].append(size_mb)
+            total_files += 1
+            total_size += size_mb
         elif not rel.endswith(".parquet"):
-            non_parquet.append(rel)
+            non_parquet_count += 1
         else:
-            bad_structure.append(rel)
+            bad_structure_count += 1
+            if len(bad_structure) < 5:
+                bad_structure.append(rel)
+
+    return {
+        "objects": object_count,
+        "namespaces": namespaces,
+        "total_files": total_files,
+        "total_size": total_size,
+        "non_parquet_count": non_parquet_count,
+        "bad_structure": bad_structure,
+        "bad_structure_count": bad_structure_count,
+    }
+
+
+def _merge_parquet_layouts(layouts) -> dict:
+    """Combine layouts classified from disjoint parts of the same listing."""
+    merged = _classify_parquet_layout((), "")
+    for layout in layouts:
+        merged["objects"] += layout["objects"]
+        merged["namespaces"].update(layout["namespaces"])
+        merged["total_files"] += layout["total_files"]
+        merged["total_size"] += layout["total_size"]
+        merged["non_parquet_count"] += layout["non_parquet_count"]
+        merged["bad_structure_count"] += layout["bad_structure_count"]
+        room = 5 - len(merged["bad_structure"])
+        merged["bad_structure"].extend(layout["bad_structure"][:room])
+    return merged
+
+
+def _analyze_parquet_layout(layout: dict, provider: str) -> bool:
+    """Report the <namespace>/<file>.parquet structure found by _classify_parquet_layout."""
+    namespaces = layout["namespaces"]
+    bad_structure = layout["bad_structure"]
+    bad_structure_count = layout["bad_structure_count"]
+    non_parquet_count = layout["non_parquet_count"]
 
     ok = True
 
-    if bad_structure:
+    if bad_structure_count:
         print(f"\n    [WARN] Parquet files without a namespace subdirectory:")
-        for f in bad_structure[:5]:
+        for f in bad_structure:
             print(f"           - {f}")
-        if len(bad_structure) > 5:
-            print(f"           ... and {len(bad_structure) - 5} more")
+        if bad_structure_count > len(bad_structure):
+            print(f"           ... and {bad_structure_count - len(bad_structure)} more")
         print(f"           These will cause 'No namespace detected' errors.")
         ok = False
 
-    if non_parquet:
-        print(f"\n    [WARN] {len(non_parquet)} non-parquet file(s) found (will be ignored by Pinecone).")
+    if non_parquet_count:
+        print(f"\n    [WARN] {non_parquet_count} non-parquet file(s) found (will be ignored by Pinecone).")
 
     if not namespaces:
         print(f"\n    [FAIL] No valid <namespace>/<file>.parquet structure found.")
         return False
 
-    total_files = sum(len(files) for files in namespaces.values())
-    total_size = sum(f["size_mb"] for files in namespaces.values() for f in files)
-    print(f"\n    Found {len(namespaces)} namespace(s), {total_files} parquet file(s), {total_size:.1f} MB total:")
-    for ns, files in sorted(namespaces.items()):
-        ns_size = sum(f["size_mb"] for f in files)
-        print(f"      {ns}/  ({len(files)} file(s), {ns_size:.1f} MB)")
-        for f in files[:3]:
-            print(f"        - {f['file']}  ({f['size_mb']:.1f} MB)")
+    print(f"\n    Found {len(namespaces)} namespace(s), {layout['total_files']} parquet file(s), "
+          f"{layout['total_size']:.1f} MB total:")
+    for ns, entry in sorted(namespaces.items()):
+        files, sizes = entry["files"], entry["sizes"]
+        print(f"      {ns}/  ({len(files)} file(s), {math.fsum(sizes):.1f} MB)")
+        for name, size_mb in zip(files[:3], sizes[:3]):
+            print(f"        - {name}  ({size_mb:.1f} MB)")
         if len(files) > 3:
             print(f"        ... and {len(files) - 3} more")
 
@@ -515,118 +637,213 @@ def _validate_uri_scheme(uri: str, env: str) -> bool:
 # Import monitoring & management (shared across all environments)
 # ---------------------------------------------------------------------------
 
-def monitor_import(index, import_id: str, poll_interval: int = 10, verbose: bool = False):
+# Base poll interval (seconds); override with --poll-interval or
+# PINECONE_POLL_INTERVAL, up to POLL_INTERVAL_LIMIT.
+DEFAULT_POLL_INTERVAL = 10
+POLL_INTERVAL_LIMIT = 300
+
+# While an import's state is unchanged, the poll interval doubles up to this
+# ceiling (seconds, or the base interval if larger); any change resets it.
+MAX_POLL_INTERVAL = 60
+_MAX_BACKOFF_ATTEMPT = 16
+
+
+def _backoff_ceiling(poll_interval: float) -> float:
+    return max(MAX_POLL_INTERVAL, poll_interval)
+
+
+async def _sleep_backoff(poll_interval: float, attempt: int, state_changed: bool) -> int:
+    """Sleep before the next poll and return the updated backoff attempt.
+
+    The delay is jittered by +/-50% so concurrent monitors don't poll in lockstep.
+    """
+    ceiling = _backoff_ceiling(poll_interval)
+    attempt = 0 if state_changed else min(attempt + 1, _MAX_BACKOFF_ATTEMPT)
+    step = min(ceiling, poll_interval * 2 ** attempt)
+    await asyncio.sleep(min(ceiling, step * random.uniform(0.5, 1.5)))
+    return attempt
+
+
+async def monitor_import_async(index, import_id: str, poll_interval: int = DEFAULT_POLL_INTERVAL,
+                               verbose: bool = False, tag: str = ""):
+    """Poll import status until it reaches a terminal state.
+
+    The blocking describe_import call runs in a worker thread, so many imports
+    can be monitored from one event loop (see monitor_many).
+    """
+    start_time = time.monotonic()
+    last_raw = None
+    last_seen = None
+    attempt = 0
+
+    while True:
+        try:
+            status = await asyncio.to_thread(index.describe_import, id=import_id)
+            elapsed = int(time.monotonic() - start_time)
+            pct = getattr(status, "percent_complete", None)
+            state = status.status
+
+            pct_str = f"{pct:.1f}%" if pct is not None else "N/A"
+            records = getattr(status, "records_imported", None) or 0
+
+            # Each poll is emitted as a single write rather than one print per line
+            if records:
+                lines = [f"{tag}[{elapsed:5d}s]  status: {state:<12}  progress: {pct_str:<8}  records imported: {records:,}"]
+            else:
+                lines = [f"{tag}[{elapsed:5d}s]  status: {state:<12}  progress: {pct_str:<8}"]
+
+            if verbose:
+                raw = _extract_all_fields(status)
+                if raw != last_raw:
+                    # First poll dumps every field; later polls only what changed
+                    lines.extend(
+                        f"{tag}           {k}: {v}" for k, v in raw.items()
+                        if last_raw is None or k not in last_raw or last_raw[k] != v
+                    )
+                    last_raw = raw
+
+            sys.stdout.write("\n".join(lines) + "\n")
+
+            if state == "Completed":
+                print("-" * 60)
+                print(f"\n{tag}Import completed successfully in {elapsed}s!")
+                _print_import_details(status, tag)
+                sys.stdout.flush()
+                return status
+
+            if state in ("Failed", "Cancelled"):
+                print("-" * 60)
+                print(f"\n{tag}Import {state.lower()}.")
+                _print_import_details(status, tag)
+                if hasattr(status, "error") and status.error:
+                    print(f"{tag}  Error: {status.error}")
+                sys.stdout.flush()
+                return status
+
+            seen = (state, pct, records)
+            attempt = await _sleep_backoff(poll_interval, attempt, seen != last_seen)
+            last_seen = seen
+
+        except Exception as e:
+            print(f"  {tag}Warning: error checking status: {e}")
+            attempt = await _sleep_backoff(poll_interval, attempt, False)
+
+
+def monitor_import(index, import_id: str, poll_interval: int = DEFAULT_POLL_INTERVAL, verbose: bool = False):
     """Poll import status until it reaches a terminal state."""
-    print(f"\nMonitoring import '{import_id}' (polling every {poll_interval}s)...")
+    print(f"\nMonitoring import '{import_id}' (polling every ~{poll_interval}s, up to {_backoff_ceiling(poll_interval)}s while idle)...")
     if verbose:
         print("Verbose mode: dumping full API response each poll.")
     print("Press Ctrl+C to stop monitoring and return to menu.")
     print("-" * 60)
 
-    start_time = time.time()
-    last_pct = None
-    last_print_time = 0
-    last_raw = None
-
     try:
-        while True:
-            try:
-                status = index.describe_import(id=import_id)
-                elapsed = int(time.time() - start_time)
-                pct = getattr(status, "percent_complete", None)
-                state = status.status
+        return asyncio.run(monitor_import_async(index, import_id, poll_interval, verbose))
+    except KeyboardInterrupt:
+        print(f"\n\nMonitoring stopped. Import '{import_id}' is still running.")
+        print(f"Use option 3 to check its status later.")
+        return None
 
-                pct_str = f"{pct:.1f}%" if pct is not None else "N/A"
-                records = getattr(status, "records_imported", None) or 0
 
-                if records:
-                    print(f"[{elapsed:5d}s]  status: {state:<12}  progress: {pct_str:<8}  records imported: {records:,}")
-                else:
-                    print(f"[{elapsed:5d}s]  status: {state:<12}  progress: {pct_str:<8}")
-
-                if verbose:
-                    raw = _extract_all_fields(status)
-                    if raw != last_raw:
-                        for k, v in raw.items():
-                            print(f"           {k}: {v}")
-                        last_raw = raw
-
-                if state == "Completed":
-                    print("-" * 60)
-                    print(f"\nImport completed successfully in {elapsed}s!")
-                    _print_import_details(status)
-                    return status
-
-                if state in ("Failed", "Cancelled"):
-                    print("-" * 60)
-                    print(f"\nImport {state.lower()}.")
-                    _print_import_details(status)
-                    if hasattr(status, "error") and status.error:
-                        print(f"  Error: {status.error}")
-                    return status
-
-                time.sleep(poll_interval)
-
-            except KeyboardInterrupt:
-                raise
-            except Exception as e:
-                print(f"  Warning: error checking status: {e}")
-                time.sleep(poll_interval)
+def monitor_many(index, import_ids: list[str], poll_interval: int = DEFAULT_POLL_INTERVAL, verbose: bool = False):
+    """Monitor several imports concurrently; returns their final statuses in order."""
+    print(f"\nMonitoring {len(import_ids)} imports (polling every ~{poll_interval}s, up to {_backoff_ceiling(poll_interval)}s while idle)...")
+    if verbose:
+        print("Verbose mode: dumping full API response each poll.")
+    print("Press Ctrl+C to stop monitoring and return to menu.")
+    print("-" * 60)
+
+    async def _monitor_all():
+        return await asyncio.gather(*(
+            monitor_import_async(index, import_id, poll_interval, verbose, tag=f"[{import_id}] ")
+            for import_id in import_ids
+        ))
 
+    try:
+        return asyncio.run(_monitor_all())
     except KeyboardInterrupt:
-        print(f"\n\nMonitoring stopped. Import '{import_id}' is still running.")
-        print(f"Use option 3 to check its status later.")
+        print(f"\n\nMonitoring stopped. Imports are still running.")
+        print(f"Use option 3 to check their status later.")
         return None
 
 
+# Public, non-callable attribute names per response type, so repeated verbose
+# polls of the same type skip dir() reflection.
+_FIELD_CACHE: dict[type, tuple[str, ...]] = {}
+
+
 def _extract_all_fields(obj):
     result = {}
     if hasattr(obj, "to_dict"):
         return obj.to_dict()
     if isinstance(obj, dict):
         return obj
-    for attr in dir(obj):
-        if attr.startswith("_"):
-            continue
+    names = _FIELD_CACHE.get(type(obj))
+    if names is None:
+        for attr in dir(obj):
+            if attr.startswith("_"):
+                continue
+            try:
+                val = getattr(obj, attr)
+                if not callable(val):
+                    result[attr] = val
+            except Exception:
+                pass
+        _FIELD_CACHE[type(obj)] = tuple(result)
+        return result
+    for attr in names:
         try:
-            val = getattr(obj, attr)
-            if not callable(val):
-                result[attr] = val
+            result[attr] = getattr(obj, attr)
         except Exception:
             pass
     return result
 
 
-def _print_import_details(status):
-    print(f"\nImport details:")
-    print(f"  ID:               {status.id}")
-    print(f"  URI:              {getattr(status, 'uri', 'N/A')}")
-    print(f"  Status:           {status.status}")
+def _print_import_details(status, tag: str = ""):
+    """Print an import's details, each line prefixed with `tag` (see monitor_many)."""
+    lines = [
+        f"\n{tag}Import details:",
+        f"{tag}  ID:               {status.id}",
+        f"{tag}  URI:              {getattr(status, 'uri', 'N/A')}",
+        f"{tag}  Status:           {status.status}",
+    ]
     pct = getattr(status, "percent_complete", None)
     if pct is not None:
-        print(f"  Percent complete: {pct:.1f}%")
+        lines.append(f"{tag}  Percent complete: {pct:.1f}%")
     records = getattr(status, "records_imported", None)
     if records is not None:
-        print(f"  Records imported: {records:,}")
+        lines.append(f"{tag}  Records imported: {records:,}")
     created = getattr(status, "created_at", None)
     if created:
-        print(f"  Created at:       {created}")
+        lines.append(f"{tag}  Created at:       {created}")
     finished = getattr(status, "finished_at", None)
     if finished:
-        print(f"  Finished at:      {finished}")
+        lines.append(f"{tag}  Finished at:      {finished}")
+    print("\n".join(lines))
+
 
+# Most recent imports shown by list_imports.
+LIST_IMPORTS_LIMIT = 50
 
-def list_imports(index):
+
+def list_imports(index, limit: int = LIST_IMPORTS_LIMIT):
     print("\nFetching imports...")
     try:
-        imports = list(index.list_imports())
-        if not imports:
+        # Pages are consumed lazily; only the newest `limit` imports are held.
+        recent = deque(maxlen=limit)
+        total = 0
+        for imp in index.list_imports():
+            recent.append(imp)
+            total += 1
+        if not total:
             print("No imports found.")
             return
-        imports.reverse()
-        print(f"\nFound {len(imports)} import(s) (newest first):")
+        if total > len(recent):
+            print(f"\nFound {total} import(s), showing the newest {len(recent)}:")
+        else:
+            print(f"\nFound {total} import(s) (newest first):")
         print("-" * 70)
-        for imp in imports:
+        for imp in reversed(recent):
             _print_import_details(imp)
             if hasattr(imp, "error") and imp.error:
                 print(f"  Error: {imp.error}")
@@ -647,24 +864,101 @@ def cancel_import(index):
         print(f"Error cancelling import: {e}")
 
 
+# Short-lived describe_index_stats cache, so e.g. viewing stats and then picking
+# a namespace to delete costs one round-trip. Keyed by id(index); the index
+# object is kept alongside so a recycled id can't return another index's stats.
+STATS_CACHE_TTL = 5.0
+_stats_cache: dict[int, tuple[float, object, object]] = {}
+
+
+def _cached_stats(index, ttl: float = STATS_CACHE_TTL):
+    entry = _stats_cache.get(id(index))
+    if entry is not None:
+        ts, cached_index, stats = entry
+        if cached_index is index and time.monotonic() - ts < ttl:
+            return stats
+    stats = index.describe_index_stats()
+    _stats_cache[id(index)] = (time.monotonic(), index, stats)
+    return stats
+
+
+def _invalidate_stats(index):
+    _stats_cache.pop(id(index), None)
+
+
+def _normalize_namespaces(stats) -> dict[str, int]:
+    """Return {namespace: vector_count} from stats given as a dict or SDK model."""
+    namespaces = stats.get("namespaces", {}) if isinstance(stats, dict) else getattr(stats, "namespaces", {})
+    return {
+        ns: info.get("vector_count", 0) if isinstance(info, dict) else getattr(info, "vector_count", 0)
+        for ns, info in (namespaces or {}).items()
+    }
+
+
+# Concurrent delete requests when deleting all namespaces.
+DELETE_WORKERS = 8
+
+
+def _delete_namespaces_concurrently(index, ns_list: list[str]) -> dict[str, Exception]:
+    """Delete namespaces in parallel, reporting each as it finishes.
+
+    A failed delete doesn't abort the rest; failures are returned by namespace.
+    """
+    failures = {}
+    with ThreadPoolExecutor(max_workers=DELETE_WORKERS) as ex:
+        futures = {
+            ex.submit(index.delete, delete_all=True, namespace=ns): ns
+            for ns in ns_list
+        }
+        for future in as_completed(futures):
+            ns = futures[future]
+            label = ns if ns != "" else "(default)"
+            try:
+                future.result()
+                print(f"  Deleted namespace: {label}")
+            except Exception as e:
+                failures[ns] = e
+                print(f"  Failed to delete namespace {label}: {e}")
+    return failures
+
+
+# Namespaces listed per page in the stats and delete menus.
+NAMESPACE_PAGE_SIZE = 50
+
+
+def _namespace_page(names: list[str], offset: int, page_size: int = NAMESPACE_PAGE_SIZE) -> list[str]:
+    """Return sorted(names)[offset:offset + page_size].
+
+    Early pages use heapq.nsmallest, O(N log K), instead of sorting every name.
+    """
+    end = offset + page_size
+    if end >= len(names):
+        return sorted(names)[offset:end]
+    return heapq.nsmallest(end, names)[offset:]
+
+
 def delete_namespace(index):
     try:
-        stats = index.describe_index_stats()
-        namespaces = stats.get("namespaces", {}) if isinstance(stats, dict) else getattr(stats, "namespaces", {})
+        namespaces = _normalize_namespaces(_cached_stats(index))
 
         if not namespaces:
             print("\nNo namespaces found in this index.")
             return
 
-        ns_list = sorted(namespaces.keys())
+        ns_list = list(namespaces)
         print(f"\nNamespaces ({len(ns_list)}):")
-        for i, ns in enumerate(ns_list, 1):
-            ns_info = namespaces[ns]
-            count = ns_info.get("vector_count", 0) if isinstance(ns_info, dict) else getattr(ns_info, "vector_count", 0)
-            label = ns if ns != "" else "(default)"
-            print(f"  {i}. {label}  ({count:,} vectors)")
-
-        selection = input("\nEnter number to delete (or 'a' to delete all, 'c' to cancel): ").strip()
+        offset = 0
+        while True:
+            page = _namespace_page(ns_list, offset)
+            for i, ns in enumerate(page, offset + 1):
+                label = ns if ns != "" else "(default)"
+                print(f"  {i}. {label}  ({namespaces[ns]:,} vectors)")
+            offset += len(page)
+            more = offset < len(ns_list)
+            more_hint = f"'n' for the next {NAMESPACE_PAGE_SIZE}, " if more else ""
+            selection = input(f"\nEnter number to delete (or {more_hint}'a' to delete all, 'c' to cancel): ").strip()
+            if not (more and selection.lower() == "n"):
+                break
 
         if selection.lower() == "c" or not selection:
             print("Cancelled.")
@@ -675,11 +969,12 @@ def delete_namespace(index):
             if confirm.lower() != "yes":
                 print("Cancelled.")
                 return
-            for ns in ns_list:
-                index.delete(delete_all=True, namespace=ns)
-                label = ns if ns != "" else "(default)"
-                print(f"  Deleted namespace: {label}")
-            print("All namespaces deleted.")
+            failures = _delete_namespaces_concurrently(index, ns_list)
+            _invalidate_stats(index)
+            if failures:
+                print(f"{len(ns_list) - len(failures)} of {len(ns_list)} namespace(s) deleted; {len(failures)} failed.")
+            else:
+                print("All namespaces deleted.")
             return
 
         try:
@@ -691,7 +986,7 @@ def delete_namespace(index):
             print("Invalid selection.")
             return
 
-        ns = ns_list[idx]
+        ns = _namespace_page(ns_list, idx, 1)[0]
         label = ns if ns != "" else "(default)"
         confirm = input(f"Delete namespace '{label}'? Type 'yes' to confirm: ").strip()
         if confirm.lower() != "yes":
@@ -699,6 +994,7 @@ def delete_namespace(index):
             return
 
         index.delete(delete_all=True, namespace=ns)
+        _invalidate_stats(index)
         print(f"Deleted namespace: {label}")
 
     except Exception as e:
@@ -707,11 +1003,11 @@ def delete_namespace(index):
 
 def describe_index_stats(index):
     try:
-        stats = index.describe_index_stats()
+        stats = _cached_stats(index)
         total = getattr(stats, "total_vector_count", None)
         dim = getattr(stats, "dimension", None)
         fullness = getattr(stats, "index_fullness", None)
-        namespaces = getattr(stats, "namespaces", {}) or {}
+        namespaces = _normalize_namespaces(stats)
 
         print(f"\nIndex Stats:")
         if dim is not None:
@@ -723,11 +1019,18 @@ def describe_index_stats(index):
 
         if namespaces:
             print(f"\n  Namespaces ({len(namespaces)}):")
-            for ns in sorted(namespaces.keys()):
-                ns_info = namespaces[ns]
-                count = ns_info.get("vector_count", 0) if isinstance(ns_info, dict) else getattr(ns_info, "vector_count", 0)
-                label = ns if ns != "" else "(default)"
-                print(f"    - {label}: {count:,} vectors")
+            ns_list = list(namespaces)
+            offset = 0
+            while offset < len(ns_list):
+                page = _namespace_page(ns_list, offset)
+                for ns in page:
+                    label = ns if ns != "" else "(default)"
+                    print(f"    - {label}: {namespaces[ns]:,} vectors")
+                offset += len(page)
+                if offset < len(ns_list):
+                    more = input(f"  Enter for the next {NAMESPACE_PAGE_SIZE} ({len(ns_list) - offset} left), 'q' to stop: ")
+                    if more.strip().lower() == "q":
+                        break
         else:
             print(f"\n  No namespaces found.")
     except Exception as e:
@@ -737,7 +1040,8 @@ def describe_index_stats(index):
 # Start import — dispatches based on environment
 # ---------------------------------------------------------------------------
 
-def start_import(index, env: str, storage_integration_id: str | None):
+def start_import(index, env: str, storage_integration_id: str | None,
+                 poll_interval: int = DEFAULT_POLL_INTERVAL):
     if env == ENV_SAAS:
         uri = input("Storage URI (e.g. s3://my-bucket/import-data): ").strip()
         if not uri:
@@ -786,9 +1090,9 @@ def start_import(index, env: str, storage_integration_id: str | None):
 
         monitor = input("\nMonitor progress? [Y/n/v(erbose)]: ").strip().lower() or "y"
         if monitor.startswith("v"):
-            monitor_import(index, import_id, verbose=True)
+            monitor_import(index, import_id, poll_interval, verbose=True)
         elif monitor.startswith("y"):
-            monitor_import(index, import_id)
+            monitor_import(index, import_id, poll_interval)
 
     except Exception as e:
         print(f"\nFailed to start import: {e}")
@@ -843,6 +1147,16 @@ def list_and_pick_index(pc: Pinecone) -> str | None:
 # Connection test
 # ---------------------------------------------------------------------------
 
+def _connect_index(pc: Pinecone, host: str):
+    """Create the single index client shared by the menu and its worker threads.
+
+    The connection pool holds DELETE_WORKERS connections, one per concurrent
+    namespace delete, so each delete worker reuses a keep-alive connection
+    whatever urllib3's 5*cpu default works out to on this host.
+    """
+    return pc.Index(host=host, connection_pool_maxsize=DELETE_WORKERS)
+
+
 def test_connection(index) -> bool:
     """Quick connectivity check by calling describe_index_stats."""
     try:
@@ -937,7 +1251,7 @@ def setup_wizard():
 
     # 5. Connect and test
     print(f"\nConnecting to index...")
-    index = pc.Index(host=index_host)
+    index = _connect_index(pc, index_host)
     if not test_connection(index):
         proceed = input("Connection test failed. Continue anyway? [y/N]: ").strip().lower()
         if not proceed.startswith("y"):
@@ -949,7 +1263,31 @@ def setup_wizard():
 # Main menu
 # ---------------------------------------------------------------------------
 
+def _poll_interval_arg(value: str) -> int:
+    try:
+        interval = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not an integer: {value!r}")
+    if not 1 <= interval <= POLL_INTERVAL_LIMIT:
+        raise argparse.ArgumentTypeError(f"must be between 1 and {POLL_INTERVAL_LIMIT} seconds")
+    return interval
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Pinecone bulk import")
+    parser.add_argument(
+        "--poll-interval",
+        type=_poll_interval_arg,
+        default=os.environ.get("PINECONE_POLL_INTERVAL", DEFAULT_POLL_INTERVAL),
+        help=f"Base seconds between import status polls (1-{POLL_INTERVAL_LIMIT}, "
+             f"default: $PINECONE_POLL_INTERVAL or {DEFAULT_POLL_INTERVAL})",
+    )
+    return parser.parse_args(argv)
+
+
 def main():
+    args = parse_args()
+    poll_interval = args.poll_interval
     pc, index, env, storage_integration_id, index_host = setup_wizard()
 
     env_label = ENV_LABELS[env]
@@ -979,16 +1317,20 @@ def main():
             break
 
         elif choice == "1":
-            start_import(index, env, storage_integration_id)
+            start_import(index, env, storage_integration_id, poll_interval)
 
         elif choice == "2":
             list_imports(index)
 
         elif choice == "3":
-            import_id = input("Enter import ID: ").strip()
-            if import_id:
+            import_ids = input("Enter import ID (comma-separated for several): ").strip()
+            ids = [i.strip() for i in import_ids.split(",") if i.strip()]
+            if ids:
                 verb = input("Verbose? [y/N]: ").strip().lower().startswith("y")
-                monitor_import(index, import_id, verbose=verb)
+                if len(ids) == 1:
+                    monitor_import(index, ids[0], poll_interval, verbose=verb)
+                else:
+                    monitor_many(index, ids, poll_interval, verbose=verb)
 
         elif choice == "4":
             cancel_import(index)
@@ -1049,7 +1391,7 @@ def main():
             if new_host:
                 index_host = new_host
                 print(f"\nConnecting to index...")
-                index = pc.Index(host=index_host)
+                index = _connect_index(pc, index_host)
                 test_connection(index)
 
         else:
@@ -30,12 +30,6 @@ while True:
 print(f"\n{'=' * 60}")
 print(f"Final status: {status.status}")
 print(f"{'=' * 60}")
-if hasattr(status, "to_dict"):
-    for k, v in status.to_dict().items():
-        print(f"  {k}: {v}")
-else:
-    for attr in dir(status):
-        if not attr.startswith("_"):
-            val = getattr(status, attr, None)
-            if not callable(val):
-                print(f"  {attr}: {val}")
+fields = status.to_dict() if hasattr(status, "to_dict") else vars(status)
+for k, v in fields.items():
+    print(f"  {k}: {v}")
@@ -2,34 +2,52 @@
 """Inspect a Parquet file to verify it's compatible with a Pinecone index."""
 
 import sys
+import pyarrow as pa
 import pyarrow.parquet as pq
 
 
 def inspect_parquet(filepath: str):
     print(f"Reading: {filepath}\n")
 
-    table = pq.read_table(filepath)
+    # Only the footer is read here; row data is streamed below.
+    pf = pq.ParquetFile(filepath)
+    schema = pf.schema_arrow
+    col_names = schema.names
 
     print(f"Schema:")
-    print(f"  {table.schema}\n")
+    print(f"  {schema}\n")
 
-    print(f"Total rows: {table.num_rows:,}")
-    print(f"Columns:    {table.column_names}\n")
+    print(f"Total rows: {pf.metadata.num_rows:,}")
+    print(f"Columns:    {col_names}\n")
+
+    first_batch = next(pf.iter_batches(batch_size=1, columns=col_names), None)
+    if first_batch is not None and first_batch.num_rows == 0:
+        first_batch = None
 
     # Check vector dimensions
-    if "values" in table.column_names:
-        first_vec = table.column("values")[0].as_py()
-        print(f"Vector dimensions: {len(first_vec)}")
+    if "values" in col_names:
+        values_type = schema.field("values").type
+        if isinstance(values_type, pa.FixedSizeListType):
+            # Fixed-size lists carry the dimension in the type itself
+            print(f"Vector dimensions: {values_type.list_size}")
+        elif first_batch is not None:
+            first_vec = first_batch.column("values")[0].values
+            print(f"Vector dimensions: {len(first_vec)}")
     else:
         print("No 'values' column found (dense vectors).")
 
-    if "sparse_values" in table.column_names:
+    if "sparse_values" in col_names:
         print("Sparse values column: present")
 
+    if first_batch is None:
+        print("\nFile contains no rows.")
+        return
+    row = {col: first_batch.column(col)[0].as_py() for col in col_names}
+
     # Show first row as a sample
     print(f"\nSample (first row):")
-    for col in table.column_names:
-        val = table.column(col)[0].as_py()
+    for col in col_names:
+        val = row[col]
         if isinstance(val, list) and len(val) > 5:
             preview = f"[{val[0]}, {val[1]}, {val[2]}, ... ] ({len(val)} elements)"
         elif isinstance(val, str) and len(val) > 200:
@@ -1,30 +1,63 @@
 #!/usr/bin/env python3
 """Pinecone BYOC Backup Script with status monitoring."""
 
+import argparse
 import getpass
+import os
+import random
 import time
 from datetime import datetime
 from pinecone import Pinecone
 
 
-def monitor_backup(pc, backup_id: str, poll_interval: int = 5):
+# Base poll interval (seconds); override with --poll-interval or
+# PINECONE_POLL_INTERVAL, up to POLL_INTERVAL_LIMIT.
+DEFAULT_POLL_INTERVAL = 5
+POLL_INTERVAL_LIMIT = 300
+
+# While the backup status is unchanged, the poll interval doubles up to this
+# ceiling (seconds, or the base interval if larger); a change resets it.
+MAX_POLL_INTERVAL = 60
+_MAX_BACKOFF_ATTEMPT = 16
+
+# An unchanged status is re-printed at most this often (seconds).
+STATUS_PRINT_INTERVAL = 30
+
+
+def _sleep_backoff(poll_interval: float, attempt: int, state_changed: bool) -> int:
+    """Sleep before the next poll and return the updated backoff attempt."""
+    ceiling = max(MAX_POLL_INTERVAL, poll_interval)
+    attempt = 0 if state_changed else min(attempt + 1, _MAX_BACKOFF_ATTEMPT)
+    step = min(ceiling, poll_interval * 2 ** attempt)
+    # +/-50% jitter so concurrent monitors don't poll in lockstep
+    time.sleep(min(ceiling, step * random.uniform(0.5, 1.5)))
+    return attempt
+
+
+def monitor_backup(pc, backup_id: str, poll_interval: int = DEFAULT_POLL_INTERVAL):
     """Monitor backup status until completion."""
-    print(f"\nMonitoring backup status (polling every {poll_interval}s)...")
+    ceiling = max(MAX_POLL_INTERVAL, poll_interval)
+    print(f"\nMonitoring backup status (polling every ~{poll_interval}s, up to {ceiling}s while idle)...")
     print("-" * 50)
     
-    start_time = time.time()
+    start_time = time.monotonic()
+    next_print = start_time + STATUS_PRINT_INTERVAL
     last_status = None
+    attempt = 0
     
     while True:
         try:
             backup = pc.describe_backup(backup_id=backup_id)
             status = backup.status
-            elapsed = int(time.time() - start_time)
+            now = time.monotonic()
+            elapsed = int(now - start_time)
             
             # Only print if status changed or every 30 seconds
-            if status != last_status or elapsed % 30 == 0:
+            status_changed = status != last_status
+            if status_changed or now >= next_print:
                 print(f"[{elapsed:4d}s] Status: {status}")
                 last_status = status
+                next_print = now + STATUS_PRINT_INTERVAL
             
             # Check for terminal states
             if status == "Ready":
@@ -50,11 +83,11 @@ def monitor_backup(pc, backup_id: str, poll_interval: int = 5):
                 print(f"\n{backup}")
                 return backup
             
-            time.sleep(poll_interval)
+            attempt = _sleep_backoff(poll_interval, attempt, status_changed)
             
         except Exception as e:
             print(f"Error checking status: {e}")
-            time.sleep(poll_interval)
+            attempt = _sleep_backoff(poll_interval, attempt, False)
 
 
 def list_backups(pc):
@@ -79,7 +112,31 @@ def list_backups(pc):
         print(f"Error listing backups: {e}")
 
 
+def _poll_interval_arg(value: str) -> int:
+    try:
+        interval = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not an integer: {value!r}")
+    if not 1 <= interval <= POLL_INTERVAL_LIMIT:
+        raise argparse.ArgumentTypeError(f"must be between 1 and {POLL_INTERVAL_LIMIT} seconds")
+    return interval
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Pinecone backup")
+    parser.add_argument(
+        "--poll-interval",
+        type=_poll_interval_arg,
+        default=os.environ.get("PINECONE_POLL_INTERVAL", DEFAULT_POLL_INTERVAL),
+        help=f"Base seconds between backup status polls (1-{POLL_INTERVAL_LIMIT}, "
+             f"default: $PINECONE_POLL_INTERVAL or {DEFAULT_POLL_INTERVAL})",
+    )
+    return parser.parse_args(argv)
+
+
 def main():
+    args = parse_args()
+
     print("=" * 60)
     print("PINECONE BACKUP")
     print("=" * 60)
@@ -106,7 +163,7 @@ def main():
     if choice == "3":
         backup_id = input("Enter backup ID: ").strip()
         if backup_id:
-            monitor_backup(pc, backup_id)
+            monitor_backup(pc, backup_id, args.poll_interval)
         return
     
     # Create new backup (choice 1)
@@ -140,7 +197,7 @@ def main():
         print(f"  Initial status: {backup.status}")
         
         # Monitor until complete
-        monitor_backup(pc, backup.backup_id)
+        monitor_backup(pc, backup.backup_id, args.poll_interval)
         
     except Exception as e:
         print(f"\nBackup failed: {e}")
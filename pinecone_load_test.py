@@ -1,42 +1,237 @@
 #!/usr/bin/env python3
 """Pinecone BYOC Load Testing Script - Multi-threaded writes and reads."""
 
+import asyncio
+import contextlib
 import getpass
+import logging
+import multiprocessing
+import os
+import queue
+import sys
 import time
-import random
 import threading
-import statistics
-from collections import defaultdict
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from itertools import count, cycle, repeat
+from logging.handlers import QueueHandler, QueueListener
+import numpy as np
 from pinecone import Pinecone
 
+try:
+    import aiohttp  # noqa: F401 - PineconeAsyncio's transport (pinecone[asyncio])
+    from pinecone import PineconeAsyncio
+    HAS_ASYNCIO = True
+except ImportError:
+    HAS_ASYNCIO = False
+
+try:
+    from pinecone.grpc import GRPCIndex, PineconeGRPC
+    HAS_GRPC = True
+except ImportError:
+    HAS_GRPC = False
 
 # Configuration
 VECTOR_DIMENSION = 1024
-BATCH_SIZE = 100  # Pinecone recommended batch size
+BATCH_SIZE = 64  # vectors per upsert request
+DOCUMENT_CHUNK_SIZE = 16 * BATCH_SIZE  # vectors generated per numpy draw, split into batches
 DEFAULT_WRITE_THREADS = 10
 DEFAULT_READ_THREADS = 20
 DEFAULT_THREADS_PER_NAMESPACE = 4
+DEFAULT_ASYNC_CONCURRENCY = 100
+AIOHTTP_CONNECTION_LIMIT = 100  # aiohttp's default per-session connection limit
+WIRE_DECIMALS = 4  # digits kept per value in request JSON
+QUERY_POOL_SIZE = 8192  # pre-generated query vectors shared by read workers
+STATIC_QUERIES_PER_THREAD = 64  # vectors each worker rotates through with static queries
+ERROR_PRINT_INTERVAL = 1.0  # min seconds between error lines from one worker
+QUERY_CACHE_SIZE = 2000  # default entries for the optional client-side query cache
+QUERY_CACHE_TTL = 60.0  # seconds a cached query result stays valid
+WORKER_JOIN_TIMEOUT = 5  # seconds to wait for each query thread after stopping
+UPSERT_POLL_INTERVAL = 0.001  # max seconds a finished REST upsert can go unstamped while the writer waits
+
+
+# Worker errors are logged through a queue: the worker only enqueues the
+# record, and a listener thread (see start_log_listener) does the printing
+_log_queue = queue.SimpleQueue()
+log = logging.getLogger("pinecone_load_test")
+log.addHandler(QueueHandler(_log_queue))
+log.propagate = False
+
+
+def start_log_listener() -> QueueListener:
+    """Start printing queued worker log records to stdout; stop() flushes them."""
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("   %(message)s"))
+    listener = QueueListener(_log_queue, handler)
+    listener.start()
+    return listener
+
+
+class _ErrorThrottle:
+    """Logs a worker's errors at most once per ERROR_PRINT_INTERVAL.
+
+    One per worker, so a burst of failures (e.g. rate limiting) doesn't
+    flood the log queue. Errors after `stop_event` is set are dropped.
+    """
+
+    __slots__ = ("stop_event", "last")
+
+    def __init__(self, stop_event):
+        self.stop_event = stop_event
+        self.last = 0.0
+
+    def warning(self, message: str):
+        now = time.monotonic()
+        if not self.stop_event.is_set() and now - self.last >= ERROR_PRINT_INTERVAL:
+            self.last = now
+            log.warning(message)
+
+
+# Latency histogram buckets (HDR-style): exact below 256us, then 128 linear
+# sub-buckets per power of two (<0.8% error), up to ~67s.
+_SUB_BITS = 7
+_SUB_COUNT = 1 << _SUB_BITS
+_MAX_LATENCY_US = (1 << 26) - 1
+_NUM_BUCKETS = (26 - _SUB_BITS + 1) * _SUB_COUNT
+
+
+def _bucket_index(latency_us: int) -> int:
+    shift = latency_us.bit_length() - _SUB_BITS - 1
+    if shift <= 0:
+        return latency_us
+    return (shift << _SUB_BITS) + (latency_us >> shift)
+
+
+def _bucket_values_us() -> np.ndarray:
+    """Midpoint latency (us) of every histogram bucket."""
+    idx = np.arange(_NUM_BUCKETS)
+    shift = np.maximum(idx // _SUB_COUNT - 1, 0)
+    lower = (idx - shift * _SUB_COUNT) << shift
+    return lower + ((1 << shift) - 1) / 2
+
+
+_BUCKET_VALUES_US = _bucket_values_us()
+
+
+class _MetricsShard:
+    """Counters and a latency histogram owned by a single worker thread.
+
+    Memory is fixed per shard no matter how long the test runs.
+    """
+
+    __slots__ = ("ops", "errors", "total_us", "min_us", "max_us", "counts")
+
+    def __init__(self):
+        self.ops = 0
+        self.errors = 0
+        self.total_us = 0
+        self.min_us = _MAX_LATENCY_US
+        self.max_us = 0
+        self.counts = [0] * _NUM_BUCKETS
+
+    def add(self, latency_us: int):
+        latency_us = min(latency_us, _MAX_LATENCY_US)
+        self.counts[_bucket_index(latency_us)] += 1
+        self.total_us += latency_us
+        if latency_us < self.min_us:
+            self.min_us = latency_us
+        if latency_us > self.max_us:
+            self.max_us = latency_us
+        self.ops += 1
 
 
 class LoadTestMetrics:
-    """Thread-safe metrics collector."""
+    """Thread-safe metrics collector.
+
+    Each recording thread gets its own shard, so the hot path never takes a
+    lock; the lock is only held while a new thread registers its shard.
+    """
     
     def __init__(self):
-        self.lock = threading.Lock()
-        self.operation_count = 0
-        self.error_count = 0
-        self.latencies = []
+        self._local = threading.local()
+        self._shards: list[_MetricsShard] = []
+        self._shards_lock = threading.Lock()
         self.start_time = None
         self.end_time = None
     
-    def record(self, latency_ms: float, success: bool = True):
-        with self.lock:
-            if success:
-                self.operation_count += 1
-                self.latencies.append(latency_ms)
-            else:
-                self.error_count += 1
+    def _shard(self) -> _MetricsShard:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = _MetricsShard()
+            with self._shards_lock:
+                self._shards.append(shard)
+        return shard
+    
+    def record_us(self, latency_us: int, success: bool = True):
+        shard = self._shard()
+        if success:
+            shard.add(latency_us)
+        else:
+            shard.errors += 1
+    
+    def snapshot(self) -> _MetricsShard:
+        """Fold every shard into one, e.g. to send back from a worker process."""
+        merged = _MetricsShard()
+        counts = np.zeros(_NUM_BUCKETS, dtype=np.int64)
+        for s in list(self._shards):
+            merged.ops += s.ops
+            merged.errors += s.errors
+            merged.total_us += s.total_us
+            merged.min_us = min(merged.min_us, s.min_us)
+            merged.max_us = max(merged.max_us, s.max_us)
+            counts += s.counts
+        merged.counts = counts.tolist()
+        return merged
+    
+    def merge(self, shard: _MetricsShard):
+        """Add a shard recorded elsewhere (see snapshot)."""
+        with self._shards_lock:
+            self._shards.append(shard)
+    
+    def counts(self) -> tuple[int, int]:
+        """Snapshot (operations, errors) for progress output.
+
+        Reads each shard's plain int counters without locking; every shard
+        has a single writer, so a reader only ever sees a slightly stale
+        value, never a torn one.
+        """
+        ops = errors = 0
+        for s in list(self._shards):
+            ops += s.ops
+            errors += s.errors
+        return ops, errors
+    
+    @property
+    def operation_count(self) -> int:
+        return sum(s.ops for s in self._shards)
+    
+    @property
+    def error_count(self) -> int:
+        return sum(s.errors for s in self._shards)
+    
+    def latency_stats(self) -> dict | None:
+        """Avg/min/max and P50/P95/P99 latency in ms, or None if nothing succeeded."""
+        shards = [s for s in list(self._shards) if s.ops]
+        if not shards:
+            return None
+        counts = np.zeros(_NUM_BUCKETS, dtype=np.int64)
+        for s in shards:
+            counts += s.counts
+        ops = int(counts.sum())
+        min_us = min(s.min_us for s in shards)
+        max_us = max(s.max_us for s in shards)
+        cum = np.cumsum(counts)
+        ranks = np.maximum(np.ceil(np.array((0.5, 0.95, 0.99)) * ops), 1)
+        p50, p95, p99 = (np.clip(_BUCKET_VALUES_US[np.searchsorted(cum, ranks)], min_us, max_us) / 1000).tolist()
+        return {
+            "avg": sum(s.total_us for s in shards) / ops / 1000,
+            "min": min_us / 1000,
+            "max": max_us / 1000,
+            "p50": p50,
+            "p95": p95,
+            "p99": p99,
+        }
     
     def start(self):
         self.start_time = time.time()
@@ -46,82 +241,318 @@ class LoadTestMetrics:
     
     def summary(self) -> dict:
         elapsed = (self.end_time or time.time()) - (self.start_time or time.time())
-        if not self.latencies:
+        lat = self.latency_stats()
+        if lat is None:
             return {"operations": 0, "errors": self.error_count, "elapsed_sec": elapsed}
         
+        operation_count = self.operation_count
         return {
-            "operations": self.operation_count,
+            "operations": operation_count,
             "errors": self.error_count,
             "elapsed_sec": round(elapsed, 2),
-            "ops_per_sec": round(self.operation_count / elapsed, 2) if elapsed > 0 else 0,
-            "avg_latency_ms": round(statistics.mean(self.latencies), 2),
-            "p50_latency_ms": round(statistics.median(self.latencies), 2),
-            "p95_latency_ms": round(sorted(self.latencies)[int(len(self.latencies) * 0.95)] if self.latencies else 0, 2),
-            "p99_latency_ms": round(sorted(self.latencies)[int(len(self.latencies) * 0.99)] if self.latencies else 0, 2),
-            "min_latency_ms": round(min(self.latencies), 2),
-            "max_latency_ms": round(max(self.latencies), 2),
+            "ops_per_sec": round(operation_count / elapsed, 2) if elapsed > 0 else 0,
+            "avg_latency_ms": round(lat["avg"], 2),
+            "p50_latency_ms": round(lat["p50"], 2),
+            "p95_latency_ms": round(lat["p95"], 2),
+            "p99_latency_ms": round(lat["p99"], 2),
+            "min_latency_ms": round(lat["min"], 2),
+            "max_latency_ms": round(lat["max"], 2),
         }
 
 
+_thread_local = threading.local()
+
+
+def _rng() -> np.random.Generator:
+    """Return this thread's NumPy Generator (Generators aren't thread-safe to share)."""
+    rng = getattr(_thread_local, "rng", None)
+    if rng is None:
+        rng = _thread_local.rng = np.random.default_rng()
+    return rng
+
+
+def generate_random_vectors(count: int, dimension: int = VECTOR_DIMENSION) -> np.ndarray:
+    """Generate a (count, dimension) float32 array of random values in [-1, 1).
+
+    Every generator in this script goes through this one vectorized draw.
+    """
+    mat = _rng().random((count, dimension), dtype=np.float32)
+    mat *= 2
+    mat -= 1
+    return mat
+
+
+def to_wire(values: np.ndarray) -> list:
+    """Convert vector rows to the nested lists sent in requests.
+
+    The Pinecone serializer only accepts plain lists, not ndarrays. float32
+    values widen to float64 floats that JSON-encode with ~17 digits; rounding
+    to WIRE_DECIMALS first cuts the request body by more than half.
+    """
+    return np.round(values.astype(np.float64), WIRE_DECIMALS).tolist()
+
+
 def generate_random_vector(dimension: int = VECTOR_DIMENSION) -> list:
     """Generate a random vector with values between -1 and 1."""
-    return [random.uniform(-1, 1) for _ in range(dimension)]
+    return to_wire(generate_random_vectors(1, dimension)[0])
 
 
-def generate_vector_batch(start_id: int, count: int) -> list:
-    """Generate a batch of vectors with sequential IDs."""
-    return [
-        {
-            "id": f"vec-{start_id + i}",
-            "values": generate_random_vector(),
-            "metadata": {"batch_id": start_id // BATCH_SIZE}
-        }
-        for i in range(count)
-    ]
+def generate_query_pool(size: int = QUERY_POOL_SIZE, dimension: int = VECTOR_DIMENSION) -> np.ndarray:
+    """Pre-generate a (size, dimension) float32 pool of random query vectors in [-1, 1).
+
+    Query workers cycle through rows of the pool instead of generating a fresh
+    vector per query, keeping RNG work out of the query loop.
+    """
+    return generate_random_vectors(size, dimension)
+
+
+def iter_query_vectors(pool: np.ndarray, static: bool = False):
+    """Endlessly yield query vectors (as lists) from `pool`, starting at a random row.
+
+    Each worker starts at its own random row so threads don't send the same
+    sequence. With `static`, the worker converts STATIC_QUERIES_PER_THREAD rows
+    once and rotates through them, which measures pure server + transport
+    throughput with no per-query vector work.
+    """
+    start = int(_rng().integers(len(pool)))
+    if static:
+        rows = np.take(pool, range(start, start + STATIC_QUERIES_PER_THREAD), axis=0, mode="wrap")
+        yield from cycle(to_wire(rows))
+    else:
+        for i in count(start):
+            yield to_wire(pool[i % len(pool)])
+
+
+@dataclass
+class BatchSoA:
+    """An upsert batch as parallel arrays rather than a list of per-vector dicts."""
+
+    ids: list[str]
+    values: np.ndarray  # (count, VECTOR_DIMENSION) float32
+    shared_metadata: dict
 
+    def __len__(self) -> int:
+        return len(self.ids)
 
-def upsert_batch(index, vectors: list, metrics: LoadTestMetrics):
-    """Upsert a batch of vectors and record metrics."""
+    def to_vectors(self) -> list:
+        """Materialize the (id, values, metadata) tuples the SDK accepts."""
+        return list(zip(self.ids, to_wire(self.values), repeat(self.shared_metadata)))
+
+
+def generate_vector_batch(start_id: int, count: int, values: np.ndarray | None = None) -> BatchSoA:
+    """Generate a batch of vectors with sequential IDs.
+
+    All values for the batch come from one (count, dimension) float32 draw
+    instead of one RNG call per vector, unless `values` is given.
+    """
+    if values is None:
+        values = generate_random_vectors(count)
+    ids = list(map("vec-{}".format, range(start_id, start_id + count)))
+    return BatchSoA(ids, values, {"batch_id": start_id // BATCH_SIZE})
+
+
+def iter_vector_batches(num_vectors: int, chunk_size: int = DOCUMENT_CHUNK_SIZE):
+    """Yield upsert batches of BATCH_SIZE for `num_vectors` sequential vectors.
+
+    Values are drawn `chunk_size` vectors at a time and each chunk is sliced
+    into batches (views, no copy), so generation runs once per chunk while
+    the previous chunk's batches are in flight.
+    """
+    for chunk_start in range(0, num_vectors, chunk_size):
+        chunk = generate_random_vectors(min(chunk_size, num_vectors - chunk_start))
+        for offset in range(0, len(chunk), BATCH_SIZE):
+            values = chunk[offset:offset + BATCH_SIZE]
+            yield generate_vector_batch(chunk_start + offset, len(values), values)
+
+
+class PendingUpsert:
+    """An upsert sent with async_req=True, stamped when it is seen to finish.
+
+    gRPC futures stamp themselves from a done callback. REST ApplyResults
+    have no callback, so poll() stamps them once ready(); the write loop
+    polls every in-flight upsert, so completions are caught in any order.
+    """
+
+    __slots__ = ("start_ns", "count", "result", "end_ns")
+
+    def __init__(self, start_ns: int, count: int, result):
+        self.start_ns = start_ns
+        self.count = count
+        self.result = result
+        self.end_ns = None
+        if hasattr(result, "add_done_callback"):
+            result.add_done_callback(self._stamp)
+
+    def _stamp(self, _=None):
+        if self.end_ns is None:
+            self.end_ns = time.perf_counter_ns()
+
+    def poll(self) -> bool:
+        """Return True (stamping the end time) once the request has finished."""
+        if self.end_ns is None and hasattr(self.result, "ready") and self.result.ready():
+            self._stamp()
+        return self.end_ns is not None
+
+    def wait(self, timeout: float):
+        """Block until the request finishes or `timeout` seconds pass."""
+        if hasattr(self.result, "ready"):
+            self.result.wait(timeout)
+        else:
+            wait([self.result], timeout)
+
+
+def start_upsert(index, batch: BatchSoA, metrics: LoadTestMetrics) -> PendingUpsert | None:
+    """Start an upsert with async_req=True on the index client's own pool.
+
+    REST clients run it on their pool_threads (see connect_index); gRPC
+    clients multiplex it on their channel. Returns None if the request
+    could not be submitted.
+    """
     try:
-        start = time.time()
-        index.upsert(vectors=vectors)
-        latency_ms = (time.time() - start) * 1000
-        metrics.record(latency_ms, success=True)
-        return len(vectors)
+        vectors = batch.to_vectors()
+        start = time.perf_counter_ns()
+        return PendingUpsert(start, len(batch), index.upsert(vectors=vectors, async_req=True))
+    except Exception as e:
+        metrics.record_us(0, success=False)
+        log.warning(f"Upsert error: {e}")
+        return None
+
+
+def finish_upsert(pending: PendingUpsert, metrics: LoadTestMetrics) -> int:
+    """Record a finished upsert's latency (from its end stamp); returns vectors written."""
+    result = pending.result
+    try:
+        result.result() if hasattr(result, "result") else result.get()
+        metrics.record_us((pending.end_ns - pending.start_ns) // 1000, success=True)
+        return pending.count
     except Exception as e:
-        metrics.record(0, success=False)
-        print(f"   Upsert error: {e}")
+        metrics.record_us(0, success=False)
+        log.warning(f"Upsert error: {e}")
         return 0
 
 
-def query_random(index, metrics: LoadTestMetrics, stop_event: threading.Event):
-    """Continuously query with random vectors until stop_event is set."""
+def collect_upserts(in_flight: list, metrics: LoadTestMetrics, timeout: float = 0) -> int:
+    """Finish every upsert in `in_flight` that is done; returns vectors written.
+
+    With a `timeout`, waits up to that long on the oldest upsert first if
+    none has finished yet.
+    """
+    done = [p for p in in_flight if p.poll()]
+    if not done and timeout and in_flight:
+        in_flight[0].wait(timeout)
+        done = [p for p in in_flight if p.poll()]
+    for p in done:
+        in_flight.remove(p)
+    return sum(finish_upsert(p, metrics) for p in done)
+
+
+class QueryCache:
+    """Thread-safe LRU + TTL cache of query results.
+
+    get() returns QueryCache.MISS when the key is absent or expired.
+    """
+
+    MISS = object()
+
+    def __init__(self, maxsize: int = QUERY_CACHE_SIZE, ttl: float = QUERY_CACHE_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and time.monotonic() - entry[0] < self.ttl:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            return self.MISS
+
+    def put(self, key, result):
+        with self._lock:
+            self._data[key] = (time.monotonic(), result)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+
+class CachedIndex:
+    """Index wrapper that answers repeated queries from a QueryCache.
+
+    Queries are keyed by namespace, top_k and a hash of the vector, computed
+    here once per query so the cache lock only ever hashes a small tuple;
+    everything else is passed through to the wrapped index. `last_hit` tells whether
+    the latest query was answered from the cache, so use one wrapper per
+    worker thread.
+    """
+
+    def __init__(self, index, cache: QueryCache):
+        self.index = index
+        self.cache = cache
+        self.last_hit = False
+
+    def query(self, **kwargs):
+        key = (kwargs.get("namespace"), kwargs.get("top_k"), hash(tuple(kwargs["vector"])))
+        result = self.cache.get(key)
+        self.last_hit = result is not QueryCache.MISS
+        if not self.last_hit:
+            result = self.index.query(**kwargs)
+            self.cache.put(key, result)
+        return result
+
+    def __getattr__(self, name):
+        return getattr(self.index, name)
+
+
+def query_random(
+    index,
+    metrics: LoadTestMetrics,
+    stop_event: threading.Event,
+    pool: np.ndarray,
+    static_queries: bool = False,
+    hit_metrics: LoadTestMetrics | None = None,
+):
+    """Continuously query with random vectors from `pool` until stop_event is set.
+
+    With a CachedIndex, pass `hit_metrics` to record cache hits there instead
+    of in `metrics`, which then only sees queries that went to the server.
+    """
+    vectors = iter_query_vectors(pool, static_queries)
+    errors = _ErrorThrottle(stop_event)
     while not stop_event.is_set():
         try:
-            query_vector = generate_random_vector()
-            start = time.time()
+            query_vector = next(vectors)
+            start = time.perf_counter_ns()
             index.query(vector=query_vector, top_k=10)
-            latency_ms = (time.time() - start) * 1000
-            metrics.record(latency_ms, success=True)
+            latency_us = (time.perf_counter_ns() - start) // 1000
+            if hit_metrics is not None and index.last_hit:
+                hit_metrics.record_us(latency_us, success=True)
+            else:
+                metrics.record_us(latency_us, success=True)
         except Exception as e:
-            metrics.record(0, success=False)
-            if not stop_event.is_set():
-                print(f"   Query error: {e}")
+            metrics.record_us(0, success=False)
+            errors.warning(f"Query error: {e}")
 
 
 class MultiNamespaceMetrics:
-    """Thread-safe metrics collector with per-namespace breakdown."""
+    """Thread-safe metrics collector with per-namespace breakdown.
 
-    def __init__(self):
-        self.lock = threading.Lock()
+    The namespaces are fixed up front and workers record by namespace id
+    into a pre-built list, so recording needs no dict lookup or lock.
+    """
+
+    def __init__(self, namespaces: list[str]):
+        self.namespaces = list(namespaces)
         self.global_metrics = LoadTestMetrics()
-        self.per_namespace: dict[str, LoadTestMetrics] = defaultdict(LoadTestMetrics)
+        self.per_namespace = [LoadTestMetrics() for _ in self.namespaces]
 
-    def record(self, namespace: str, latency_ms: float, success: bool = True):
-        self.global_metrics.record(latency_ms, success)
-        with self.lock:
-            ns_metrics = self.per_namespace[namespace]
-        ns_metrics.record(latency_ms, success)
+    def record_us(self, ns_id: int, latency_us: int, success: bool = True):
+        self.global_metrics.record_us(latency_us, success)
+        self.per_namespace[ns_id].record_us(latency_us, success)
 
     def start(self):
         self.global_metrics.start()
@@ -133,16 +564,15 @@ class MultiNamespaceMetrics:
         return self.global_metrics.summary()
 
     def per_namespace_summary(self) -> dict[str, dict]:
-        with self.lock:
-            namespaces = dict(self.per_namespace)
         result = {}
-        for ns, m in namespaces.items():
-            if m.latencies:
+        for ns, m in zip(self.namespaces, self.per_namespace):
+            lat = m.latency_stats()
+            if lat is not None:
                 result[ns] = {
                     "queries": m.operation_count,
                     "errors": m.error_count,
-                    "avg_ms": round(statistics.mean(m.latencies), 2),
-                    "p50_ms": round(statistics.median(m.latencies), 2),
+                    "avg_ms": round(lat["avg"], 2),
+                    "p50_ms": round(lat["p50"], 2),
                 }
         return result
 
@@ -150,42 +580,188 @@ class MultiNamespaceMetrics:
 def query_namespace(
     index,
     namespace: str,
+    ns_id: int,
     metrics: MultiNamespaceMetrics,
     stop_event: threading.Event,
+    pool: np.ndarray,
     top_k: int = 10,
+    static_queries: bool = False,
 ):
-    """Continuously query a specific namespace until stop_event is set."""
+    """Continuously query a specific namespace until stop_event is set.
+
+    `ns_id` is the namespace's position in `metrics.namespaces`.
+    """
+    vectors = iter_query_vectors(pool, static_queries)
+    errors = _ErrorThrottle(stop_event)
     while not stop_event.is_set():
         try:
-            query_vector = generate_random_vector()
-            start = time.time()
+            query_vector = next(vectors)
+            start = time.perf_counter_ns()
             index.query(vector=query_vector, top_k=top_k, namespace=namespace)
-            latency_ms = (time.time() - start) * 1000
-            metrics.record(namespace, latency_ms, success=True)
+            latency_us = (time.perf_counter_ns() - start) // 1000
+            metrics.record_us(ns_id, latency_us, success=True)
         except Exception as e:
-            metrics.record(namespace, 0, success=False)
-            if not stop_event.is_set():
-                print(f"   Query error [{namespace}]: {e}")
+            metrics.record_us(ns_id, 0, success=False)
+            errors.warning(f"Query error [{namespace}]: {e}")
 
 
-def run_aggressive_multi_namespace_read_test(
+def default_storm_processes() -> int:
+    """One storm process per CPU, or a single process on a free-threaded build.
+
+    With the GIL enabled, thousands of storm threads in one process contend
+    on it for every RNG, serialization and metrics step; separate processes
+    each get their own. Without the GIL (PEP 703 builds) threads already
+    scale across cores.
+    """
+    gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    return (os.cpu_count() or 1) if gil_enabled else 1
+
+
+def start_progress_reporter(stop_event: threading.Event, duration_seconds: int, report):
+    """Call `report(remaining_seconds)` about once a second from a daemon thread.
+
+    Keeps progress output off the thread that times the test; the reporter
+    exits as soon as stop_event is set.
+    """
+    deadline = time.monotonic() + duration_seconds
+
+    def loop():
+        while not stop_event.is_set():
+            report(max(round(deadline - time.monotonic()), 0))
+            stop_event.wait(1)
+
+    thread = threading.Thread(target=loop, daemon=True)
+    thread.start()
+    return thread
+
+
+def _run_storm_threads(
     index,
+    namespaces: list[str],
+    metrics: MultiNamespaceMetrics,
+    threads_per_namespace: int,
+    top_k: int,
+    duration_seconds: int,
+    report,
+    static_queries: bool = False,
+):
+    """Query every namespace from `threads_per_namespace` threads each.
+
+    `report(remaining_seconds)` is called about once a second while the
+    workers run (see start_progress_reporter).
+    """
+    total_threads = len(namespaces) * threads_per_namespace
+    stop_event = threading.Event()
+    pool = generate_query_pool()
+
+    warm_connections(index, total_threads)
+    metrics.start()
+
+    # Long-lived workers get plain threads; an executor's queue and futures
+    # would only add bookkeeping for tasks that run the whole test
+    threads = [
+        threading.Thread(
+            target=query_namespace,
+            args=(index, ns, ns_id, metrics, stop_event, pool, top_k, static_queries),
+            daemon=True,
+        )
+        for ns_id, ns in enumerate(namespaces)
+        for _ in range(threads_per_namespace)
+    ]
+    for t in threads:
+        t.start()
+
+    start_progress_reporter(stop_event, duration_seconds, report)
+    stop_event.wait(timeout=duration_seconds)
+    stop_event.set()
+    for t in threads:
+        t.join(timeout=WORKER_JOIN_TIMEOUT)
+
+    metrics.stop()
+
+
+_storm_progress = None
+_storm_started = None
+
+
+def _init_storm_process(progress, started):
+    global _storm_progress, _storm_started
+    _storm_progress = progress
+    _storm_started = started
+
+
+def _storm_process(
+    slot: int,
+    api_key: str,
+    host: str,
+    namespaces: list[str],
+    threads_per_namespace: int,
+    top_k: int,
+    duration_seconds: int,
+    static_queries: bool = False,
+):
+    """Run one process's share of the storm.
+
+    Publishes (queries, errors) into slot `slot` of the shared progress array
+    and its metrics start time into the shared start-time array, and returns
+    (start_time, end_time, per-namespace metric snapshots).
+    """
+    index = connect_index(Pinecone(api_key=api_key), host, len(namespaces) * threads_per_namespace)
+    metrics = MultiNamespaceMetrics(namespaces)
+
+    def report(remaining):
+        _storm_started[slot] = metrics.global_metrics.start_time
+        _storm_progress[2 * slot], _storm_progress[2 * slot + 1] = metrics.global_metrics.counts()
+
+    listener = start_log_listener()
+    try:
+        _run_storm_threads(
+            index, namespaces, metrics, threads_per_namespace, top_k, duration_seconds, report, static_queries
+        )
+    finally:
+        listener.stop()
+    report(0)
+    gm = metrics.global_metrics
+    return gm.start_time, gm.end_time, [m.snapshot() for m in metrics.per_namespace]
+
+
+def run_aggressive_multi_namespace_read_test(
+    pc: Pinecone,
+    host: str,
     duration_seconds: int,
     threads_per_namespace: int = DEFAULT_THREADS_PER_NAMESPACE,
     top_k: int = 10,
+    processes: int | None = None,
+    static_queries: bool = False,
+    index_for=None,
 ):
     """Run an aggressive read load test that queries ALL namespaces concurrently.
 
     Discovers all namespaces from the index stats, then launches
     `threads_per_namespace` worker threads per namespace, all running
-    simultaneously for maximum query pressure.
+    simultaneously for maximum query pressure. The workers share an index
+    client whose connection pool is sized to the total thread count.
+
+    With `processes` > 1 (default: default_storm_processes()) the namespaces
+    are split round-robin across that many worker processes, each running
+    its own threads and client; their metrics are merged at the end.
+    `static_queries` is passed through to iter_query_vectors.
+
+    `index_for(workers)` returns an index client whose pool fits `workers`
+    (main passes its shared, growable client); it is used for discovery and
+    the single-process storm. By default a new client is opened.
     """
+    if index_for is None:
+        def index_for(workers: int):
+            return connect_index(pc, host, workers)
+
     print(f"\n{'='*60}")
     print(f"AGGRESSIVE MULTI-NAMESPACE QUERY STORM")
     print(f"{'='*60}")
 
     # Discover namespaces
     print("Discovering namespaces...")
+    index = index_for(1)
     stats = index.describe_index_stats()
     namespaces = list(stats.namespaces.keys()) if stats.namespaces else []
 
@@ -198,50 +774,86 @@ def run_aggressive_multi_namespace_read_test(
 
     num_ns = len(namespaces)
     total_threads = num_ns * threads_per_namespace
+    if processes is None:
+        processes = default_storm_processes()
+    processes = max(1, min(processes, num_ns))
     print(f"Namespaces discovered: {num_ns}")
     print(f"Threads per namespace: {threads_per_namespace}")
     print(f"Total concurrent threads: {total_threads:,}")
+    print(f"Worker processes: {processes}")
     print(f"Duration: {duration_seconds}s")
     print(f"top_k: {top_k}")
+    print(f"Static queries: {'yes' if static_queries else 'no'}")
     print(f"Total vectors in index: {stats.total_vector_count:,}")
 
-    metrics = MultiNamespaceMetrics()
-    stop_event = threading.Event()
+    metrics = MultiNamespaceMetrics(namespaces)
+    print(f"Warming {total_threads:,} connections...")
+    last_ops = 0
 
-    print(f"\nLaunching {total_threads:,} query threads across {num_ns} namespaces...")
-    metrics.start()
+    def report(remaining, current_ops, current_errors):
+        nonlocal last_ops
+        delta = current_ops - last_ops
+        last_ops = current_ops
+        sys.stdout.write(
+            f"   {remaining:>4}s remaining | "
+            f"{current_ops:>10,} queries | "
+            f"~{delta:,} qps | "
+            f"{current_errors} errors\r"
+        )
+        sys.stdout.flush()
 
-    with ThreadPoolExecutor(max_workers=total_threads) as executor:
-        futures = []
-        for ns in namespaces:
-            for _ in range(threads_per_namespace):
-                futures.append(
-                    executor.submit(query_namespace, index, ns, metrics, stop_event, top_k)
+    if processes == 1:
+        index = index_for(total_threads)
+        print(f"\nLaunching {total_threads:,} query threads across {num_ns} namespaces...")
+        _run_storm_threads(
+            index, namespaces, metrics, threads_per_namespace, top_k, duration_seconds,
+            lambda remaining: report(remaining, *metrics.global_metrics.counts()),
+            static_queries,
+        )
+        print(f"\n   Stopped {total_threads:,} threads.")
+    else:
+        print(
+            f"\nLaunching {total_threads:,} query threads across {num_ns} namespaces "
+            f"in {processes} processes..."
+        )
+        ctx = multiprocessing.get_context("spawn")
+        progress = ctx.Array("q", 2 * processes, lock=False)
+        started = ctx.Array("d", processes, lock=False)
+        with ProcessPoolExecutor(
+            max_workers=processes, mp_context=ctx,
+            initializer=_init_storm_process, initargs=(progress, started),
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _storm_process, slot, pc.config.api_key, host, namespaces[slot::processes],
+                    threads_per_namespace, top_k, duration_seconds, static_queries,
                 )
+                for slot in range(processes)
+            ]
+            # Children start their clocks only after spawning, connecting and
+            # warming up, so count down from the latest child that has started
+            while wait(futures, timeout=1).not_done:
+                start = max(started)
+                remaining = max(duration_seconds - int(time.time() - start), 0) if start else duration_seconds
+                report(remaining, sum(progress[0::2]), sum(progress[1::2]))
 
-        # Progress reporting
-        start = time.time()
-        last_ops = 0
-        while time.time() - start < duration_seconds:
-            elapsed = int(time.time() - start)
-            remaining = duration_seconds - elapsed
-            current_ops = metrics.global_metrics.operation_count
-            current_errors = metrics.global_metrics.error_count
-            delta = current_ops - last_ops
-            last_ops = current_ops
-            print(
-                f"   {remaining:>4}s remaining | "
-                f"{current_ops:>10,} queries | "
-                f"~{delta:,} qps | "
-                f"{current_errors} errors",
-                end="\r",
-            )
-            time.sleep(1)
-
-        stop_event.set()
-        print(f"\n   Stopping {total_threads:,} threads...")
-
-    metrics.stop()
+            starts, ends = [], []
+            for slot, future in enumerate(futures):
+                try:
+                    start_time, end_time, snapshots = future.result()
+                except Exception as e:
+                    print(f"\n   Storm process {slot} failed: {e}")
+                    continue
+                starts.append(start_time)
+                ends.append(end_time)
+                for ns_id, shard in zip(range(slot, num_ns, processes), snapshots):
+                    metrics.per_namespace[ns_id].merge(shard)
+                    metrics.global_metrics.merge(shard)
+        print(f"\n   Stopped {processes} processes.")
+        if not starts:
+            return
+        metrics.global_metrics.start_time = min(starts)
+        metrics.global_metrics.end_time = max(ends)
 
     # --- Aggregate results ---
     print(f"\n{'='*60}")
@@ -265,58 +877,75 @@ def run_aggressive_multi_namespace_read_test(
         print(f"\n{'='*60}")
         print(f"PER-NAMESPACE BREAKDOWN (top 20 by query count)")
         print(f"{'='*60}")
-        sorted_ns = sorted(ns_summary.items(), key=lambda x: x[1]["queries"], reverse=True)
+        names = list(ns_summary)
+        rows = list(ns_summary.values())
+        queries = np.fromiter((r["queries"] for r in rows), dtype=np.int64, count=len(rows))
+        avgs = np.fromiter((r["avg_ms"] for r in rows), dtype=np.float64, count=len(rows))
+        # Partial sort: only the top 20 by query count need ordering
+        top = np.argpartition(-queries, 19)[:20] if len(rows) > 20 else np.arange(len(rows))
+        top = top[np.argsort(-queries[top], kind="stable")]
         print(f"{'Namespace':<30} {'Queries':>10} {'Errors':>8} {'Avg ms':>10} {'P50 ms':>10}")
         print("-" * 72)
-        for ns_name, ns_data in sorted_ns[:20]:
+        for i in top:
+            ns_name, ns_data = names[i], rows[i]
             display_name = ns_name if ns_name else "(default)"
             print(
                 f"{display_name:<30} {ns_data['queries']:>10,} {ns_data['errors']:>8} "
                 f"{ns_data['avg_ms']:>10.2f} {ns_data['p50_ms']:>10.2f}"
             )
-        if len(sorted_ns) > 20:
-            print(f"   ... and {len(sorted_ns) - 20} more namespaces")
+        if len(rows) > 20:
+            print(f"   ... and {len(rows) - 20} more namespaces")
 
         # Hottest / coldest
-        fastest = min(sorted_ns, key=lambda x: x[1]["avg_ms"])
-        slowest = max(sorted_ns, key=lambda x: x[1]["avg_ms"])
-        print(f"\nFastest namespace:   {fastest[0] or '(default)'} — avg {fastest[1]['avg_ms']}ms")
-        print(f"Slowest namespace:   {slowest[0] or '(default)'} — avg {slowest[1]['avg_ms']}ms")
+        fastest, slowest = int(avgs.argmin()), int(avgs.argmax())
+        print(f"\nFastest namespace:   {names[fastest] or '(default)'} — avg {avgs[fastest]}ms")
+        print(f"Slowest namespace:   {names[slowest] or '(default)'} — avg {avgs[slowest]}ms")
 
 
 def run_write_load_test(index, num_vectors: int, num_threads: int = DEFAULT_WRITE_THREADS):
-    """Run write load test with multi-threaded batch upserts."""
+    """Run write load test with concurrent batch upserts.
+
+    Batches are sent with async_req=True, so the index client provides the
+    concurrency: its own thread pool (see connect_index) over REST, or
+    native futures with a gRPC client (see connect_grpc_index).
+    """
     print(f"\n{'='*60}")
     print(f"WRITE LOAD TEST")
     print(f"{'='*60}")
     print(f"Vectors to upsert: {num_vectors:,}")
     print(f"Batch size: {BATCH_SIZE}")
-    print(f"Threads: {num_threads}")
+    runner = "the gRPC channel" if HAS_GRPC and isinstance(index, GRPCIndex) else "the client's pool_threads"
+    print(f"Concurrent upserts: {num_threads} (async_req on {runner})")
     print(f"Vector dimension: {VECTOR_DIMENSION}")
     
     metrics = LoadTestMetrics()
     total_batches = (num_vectors + BATCH_SIZE - 1) // BATCH_SIZE
     vectors_upserted = 0
     
+    print(f"Warming {num_threads:,} connections...")
+    warm_connections(index, num_threads)
+    
     print(f"\nGenerating and upserting {total_batches} batches...")
     metrics.start()
     
-    with ThreadPoolExecutor(max_workers=num_threads) as executor:
-        futures = []
-        
-        for batch_num in range(total_batches):
-            start_id = batch_num * BATCH_SIZE
-            count = min(BATCH_SIZE, num_vectors - start_id)
-            vectors = generate_vector_batch(start_id, count)
-            futures.append(executor.submit(upsert_batch, index, vectors, metrics))
-            
-            # Progress update every 10 batches
-            if (batch_num + 1) % 10 == 0:
-                print(f"   Submitted {batch_num + 1}/{total_batches} batches...")
+    # Keep at most num_threads upserts in flight so a batch's latency isn't
+    # time spent queued in the client, and collect them as they finish
+    in_flight = []
+    for batch_num, batch in enumerate(iter_vector_batches(num_vectors)):
+        vectors_upserted += collect_upserts(in_flight, metrics)
+        while len(in_flight) >= num_threads:
+            vectors_upserted += collect_upserts(in_flight, metrics, UPSERT_POLL_INTERVAL)
+        pending = start_upsert(index, batch, metrics)
+        if pending is not None:
+            in_flight.append(pending)
         
-        # Wait for all to complete
-        for future in as_completed(futures):
-            vectors_upserted += future.result()
+        # Progress update every 10 batches
+        if (batch_num + 1) % 10 == 0:
+            print(f"   Submitted {batch_num + 1}/{total_batches} batches...")
+    
+    # Wait for the rest to complete
+    while in_flight:
+        vectors_upserted += collect_upserts(in_flight, metrics, UPSERT_POLL_INTERVAL)
     
     metrics.stop()
     
@@ -336,45 +965,90 @@ def run_write_load_test(index, num_vectors: int, num_threads: int = DEFAULT_WRIT
     return vectors_upserted
 
 
-def run_read_load_test(index, duration_seconds: int, num_threads: int = DEFAULT_READ_THREADS):
-    """Run read load test with multi-threaded random queries."""
+def run_read_load_test(
+    index,
+    duration_seconds: int,
+    num_threads: int = DEFAULT_READ_THREADS,
+    static_queries: bool = False,
+    cache_size: int = 0,
+):
+    """Run read load test with multi-threaded random queries.
+
+    With `static_queries`, each thread rotates through a small fixed set of
+    vectors (see iter_query_vectors). A `cache_size` > 0 answers repeated
+    queries from a client-side QueryCache; cache hits are recorded in their
+    own metrics, so the main results only describe queries the server saw.
+    """
     print(f"\n{'='*60}")
     print(f"READ LOAD TEST")
     print(f"{'='*60}")
     print(f"Duration: {duration_seconds} seconds")
     print(f"Threads: {num_threads}")
-    print(f"Query type: Random vector, top_k=10")
+    print(f"Query type: {'Static' if static_queries else 'Random'} vector, top_k=10")
+    
+    cache = None
+    if cache_size > 0:
+        cache = QueryCache(cache_size)
+        print(f"Query cache: {cache_size:,} entries, {QUERY_CACHE_TTL:g}s TTL")
     
     metrics = LoadTestMetrics()
+    hit_metrics = LoadTestMetrics() if cache else None
     stop_event = threading.Event()
+    pool = generate_query_pool()
+    print(f"Warming {num_threads:,} connections...")
+    warm_connections(index, num_threads)
     
     print(f"\nRunning queries for {duration_seconds}s...")
     metrics.start()
     
-    with ThreadPoolExecutor(max_workers=num_threads) as executor:
-        # Start all query threads
-        futures = [
-            executor.submit(query_random, index, metrics, stop_event)
-            for _ in range(num_threads)
-        ]
-        
-        # Wait for duration, showing progress
-        start = time.time()
-        while time.time() - start < duration_seconds:
-            elapsed = int(time.time() - start)
-            remaining = duration_seconds - elapsed
-            current_ops = metrics.operation_count
-            print(f"   {remaining}s remaining... ({current_ops:,} queries so far)", end='\r')
-            time.sleep(1)
-        
-        # Signal threads to stop
-        stop_event.set()
-        print(f"\n   Stopping threads...")
+    # Start all query threads
+    threads = [
+        threading.Thread(
+            target=query_random,
+            args=(
+                CachedIndex(index, cache) if cache else index,
+                metrics, stop_event, pool, static_queries, hit_metrics,
+            ),
+            daemon=True,
+        )
+        for _ in range(num_threads)
+    ]
+    for t in threads:
+        t.start()
+    
+    def report(remaining):
+        current_ops, _ = metrics.counts()
+        if hit_metrics is not None:
+            current_ops += hit_metrics.counts()[0]
+        sys.stdout.write(f"   {remaining}s remaining... ({current_ops:,} queries so far)\r")
+        sys.stdout.flush()
+    
+    # Wait for duration; progress is printed from its own thread
+    start_progress_reporter(stop_event, duration_seconds, report)
+    stop_event.wait(timeout=duration_seconds)
+    
+    # Signal threads to stop
+    stop_event.set()
+    print(f"\n   Stopping threads...")
+    for t in threads:
+        t.join(timeout=WORKER_JOIN_TIMEOUT)
     
     metrics.stop()
     
+    print_read_results(metrics.summary())
+    if cache:
+        lookups = cache.hits + cache.misses
+        hit_rate = 100 * cache.hits / lookups if lookups else 0
+        print(f"\n--- Query Cache (not included above) ---")
+        print(f"Cache hits: {cache.hits:,} / misses: {cache.misses:,} ({hit_rate:.1f}% hit rate)")
+        lat = hit_metrics.latency_stats()
+        if lat is not None:
+            print(f"Hit latency: avg {lat['avg']:.3f}ms, P50 {lat['p50']:.3f}ms, P99 {lat['p99']:.3f}ms")
+
+
+def print_read_results(summary: dict):
+    """Print the results block shared by the threaded and asyncio read tests."""
     print(f"\n--- Read Results ---")
-    summary = metrics.summary()
     print(f"Total queries: {summary['operations']:,}")
     print(f"Errors: {summary['errors']}")
     print(f"Total time: {summary['elapsed_sec']}s")
@@ -387,6 +1061,120 @@ def run_read_load_test(index, duration_seconds: int, num_threads: int = DEFAULT_
     print(f"Max latency: {summary['max_latency_ms']}ms")
 
 
+async def query_random_async(
+    index,
+    metrics: LoadTestMetrics,
+    stop_event: asyncio.Event,
+    pool: np.ndarray,
+    static_queries: bool = False,
+):
+    """Coroutine version of query_random for the asyncio read test."""
+    vectors = iter_query_vectors(pool, static_queries)
+    errors = _ErrorThrottle(stop_event)
+    while not stop_event.is_set():
+        try:
+            query_vector = next(vectors)
+            start = time.perf_counter_ns()
+            await index.query(vector=query_vector, top_k=10)
+            latency_us = (time.perf_counter_ns() - start) // 1000
+            metrics.record_us(latency_us, success=True)
+        except Exception as e:
+            metrics.record_us(0, success=False)
+            errors.warning(f"Query error: {e}")
+
+
+async def _run_async_queries(
+    indexes: list,
+    duration_seconds: int,
+    concurrency: int,
+    metrics: LoadTestMetrics,
+    static_queries: bool = False,
+):
+    """Run `concurrency` query coroutines for the given duration.
+
+    Coroutines are spread round-robin over `indexes`. One request per
+    coroutine is sent first, untimed, so connection setup stays out of the
+    measured latencies (as warm_connections does for the threaded tests).
+    """
+    stop_event = asyncio.Event()
+    pool = generate_query_pool()
+    for result in await asyncio.gather(
+        *(indexes[i % len(indexes)].describe_index_stats() for i in range(concurrency)),
+        return_exceptions=True,
+    ):
+        if isinstance(result, Exception):
+            print(f"   Warm-up error: {result}")
+            break
+    metrics.start()
+    workers = [
+        asyncio.create_task(
+            query_random_async(indexes[i % len(indexes)], metrics, stop_event, pool, static_queries)
+        )
+        for i in range(concurrency)
+    ]
+
+    start = time.time()
+    while time.time() - start < duration_seconds:
+        elapsed = int(time.time() - start)
+        remaining = duration_seconds - elapsed
+        current_ops = metrics.operation_count
+        sys.stdout.write(f"   {remaining}s remaining... ({current_ops:,} queries so far)\r")
+        sys.stdout.flush()
+        await asyncio.sleep(1)
+
+    stop_event.set()
+    print(f"\n   Stopping {concurrency} query tasks...")
+    await asyncio.gather(*workers)
+    metrics.stop()
+
+
+def run_async_read_load_test(
+    api_key: str,
+    host: str,
+    duration_seconds: int,
+    concurrency: int = DEFAULT_ASYNC_CONCURRENCY,
+    static_queries: bool = False,
+):
+    """Run the read load test on one asyncio event loop instead of a thread pool.
+
+    Each in-flight query is a coroutine rather than an OS thread, so a single
+    process can keep far more requests outstanding without GIL contention.
+    The SDK's aiohttp session caps connections at AIOHTTP_CONNECTION_LIMIT,
+    so one IndexAsyncio client is opened per that many coroutines.
+    Requires the pinecone[asyncio] extra.
+    """
+    print(f"\n{'='*60}")
+    print(f"ASYNC READ LOAD TEST")
+    print(f"{'='*60}")
+    if not HAS_ASYNCIO:
+        print("The asyncio client is not installed. Run: pip install 'pinecone[asyncio]'")
+        return
+
+    print(f"Duration: {duration_seconds} seconds")
+    num_clients = -(-concurrency // AIOHTTP_CONNECTION_LIMIT)
+    print(f"Concurrent queries: {concurrency} over {num_clients} client(s)")
+    print(f"Query type: {'Static' if static_queries else 'Random'} vector, top_k=10")
+
+    async def _run(metrics):
+        async with PineconeAsyncio(api_key=api_key) as pc, contextlib.AsyncExitStack() as stack:
+            indexes = [
+                await stack.enter_async_context(pc.IndexAsyncio(host=host))
+                for _ in range(num_clients)
+            ]
+            await _run_async_queries(indexes, duration_seconds, concurrency, metrics, static_queries)
+
+    metrics = LoadTestMetrics()
+    print(f"Warming {concurrency:,} connections...")
+    print(f"\nRunning queries for {duration_seconds}s...")
+    try:
+        asyncio.run(_run(metrics))
+    except KeyboardInterrupt:
+        print("\n   Interrupted.")
+        metrics.stop()
+
+    print_read_results(metrics.summary())
+
+
 def delete_all_vectors(index):
     """Delete all vectors from the index."""
     print(f"\n{'='*60}")
@@ -419,6 +1207,44 @@ def delete_all_vectors(index):
         print(f"Delete error: {e}")
 
 
+def connect_index(pc: Pinecone, host: str, pool_size: int):
+    """Open an index client whose HTTP connection pool fits `pool_size` workers.
+
+    urllib3 keeps only 5*cpu connections per host by default; with more worker
+    threads than that, requests queue for a connection or open throwaway ones,
+    which shows up as inflated tail latency rather than backend slowness.
+    pool_threads sizes the client's own pool, which runs async_req upserts.
+    """
+    pool_size = max(pool_size, 1)
+    return pc.Index(host=host, pool_threads=pool_size, connection_pool_maxsize=pool_size)
+
+
+def connect_grpc_index(api_key: str, host: str):
+    """Open a gRPC index client for upserts (requires the pinecone[grpc] extra).
+
+    Vectors go over the wire as protobuf float32 instead of JSON text, about
+    a quarter of the request bytes, and async_req upserts are native gRPC
+    futures on one multiplexed channel rather than pool threads.
+    """
+    return PineconeGRPC(api_key=api_key).Index(host=host)
+
+
+def warm_connections(index, num_connections: int):
+    """Open `num_connections` keep-alive connections before a timed run.
+
+    Fires that many describe_index_stats calls at once so the workers' first
+    queries reuse established connections instead of paying for TCP/TLS
+    setup inside the measured latencies.
+    """
+    with ThreadPoolExecutor(max_workers=num_connections) as executor:
+        for future in [executor.submit(index.describe_index_stats) for _ in range(num_connections)]:
+            try:
+                future.result()
+            except Exception as e:
+                print(f"   Warm-up error: {e}")
+                break
+
+
 def show_index_stats(index):
     """Display current index statistics."""
     print(f"\n--- Index Stats ---")
@@ -462,6 +1288,19 @@ def prompt_yes_no(message: str, default: bool = True) -> bool:
         print("Please enter 'y' or 'n'.")
 
 
+def prompt_static_queries() -> bool:
+    """Ask whether read workers should reuse a fixed per-thread query set."""
+    return prompt_yes_no(
+        f"Static queries (each thread reuses {STATIC_QUERIES_PER_THREAD} fixed vectors)?",
+        default=False,
+    )
+
+
+def prompt_grpc_writes() -> bool:
+    """Ask whether upserts should use the gRPC client, if it is installed."""
+    return HAS_GRPC and prompt_yes_no("Send upserts over gRPC?", default=True)
+
+
 def main_menu():
     """Display main menu and get selection."""
     print(f"\n{'='*60}")
@@ -470,20 +1309,21 @@ def main_menu():
     print("1. Full test (write + read + optional delete)")
     print("2. Write only (upsert vectors)")
     print("3. Read only (query existing vectors)")
-    print("4. Aggressive multi-namespace query storm")
-    print("5. Delete all vectors")
-    print("6. Show index stats")
-    print("7. Exit")
+    print("4. Read only, asyncio (high-concurrency queries)")
+    print("5. Aggressive multi-namespace query storm")
+    print("6. Delete all vectors")
+    print("7. Show index stats")
+    print("8. Exit")
     print()
     
     while True:
         try:
-            choice = int(input("Select option [1-7]: "))
-            if 1 <= choice <= 7:
+            choice = int(input("Select option [1-8]: "))
+            if 1 <= choice <= 8:
                 return choice
         except ValueError:
             pass
-        print("Please enter a number 1-7.")
+        print("Please enter a number 1-8.")
 
 
 def main():
@@ -505,7 +1345,27 @@ def main():
     # Initialize client
     print("\nConnecting to Pinecone...")
     pc = Pinecone(api_key=api_key)
-    index = pc.Index(host=pinecone_host)
+    index_pool = max(DEFAULT_READ_THREADS, DEFAULT_WRITE_THREADS)
+    index = connect_index(pc, pinecone_host, index_pool)
+    
+    def index_for(workers: int):
+        """Return the shared index client, reopening it only if `workers` outgrows its pool."""
+        nonlocal index, index_pool
+        if workers > index_pool:
+            index_pool = workers
+            index = connect_index(pc, pinecone_host, index_pool)
+        return index
+    
+    grpc_index = None
+    
+    def write_index_for(workers: int):
+        """Return the index client upserts should use: gRPC if chosen, else index_for()."""
+        nonlocal grpc_index
+        if not prompt_grpc_writes():
+            return index_for(workers)
+        if grpc_index is None:
+            grpc_index = connect_grpc_index(api_key, pinecone_host)
+        return grpc_index
     
     # Verify connection
     try:
@@ -522,7 +1382,7 @@ def main():
             num_vectors = prompt_int("Number of vectors to generate", 10000)
             write_threads = prompt_int("Number of write threads", DEFAULT_WRITE_THREADS)
             
-            run_write_load_test(index, num_vectors, write_threads)
+            run_write_load_test(write_index_for(write_threads), num_vectors, write_threads)
             
             # Wait for vectors to be indexed
             print("\nWaiting 5s for vectors to be indexed...")
@@ -531,8 +1391,11 @@ def main():
             
             read_duration = prompt_int("Seconds to run read test", 30)
             read_threads = prompt_int("Number of read threads", DEFAULT_READ_THREADS)
+            static_queries = prompt_static_queries()
+            cache_size = prompt_int("Query cache entries (0 = off)", 0)
             
-            run_read_load_test(index, read_duration, read_threads)
+            index = index_for(read_threads)
+            run_read_load_test(index, read_duration, read_threads, static_queries, cache_size)
             
             if prompt_yes_no("\nDelete all vectors?", default=False):
                 delete_all_vectors(index)
@@ -542,7 +1405,7 @@ def main():
         elif choice == 2:  # Write only
             num_vectors = prompt_int("Number of vectors to generate", 10000)
             write_threads = prompt_int("Number of write threads", DEFAULT_WRITE_THREADS)
-            run_write_load_test(index, num_vectors, write_threads)
+            run_write_load_test(write_index_for(write_threads), num_vectors, write_threads)
             time.sleep(2)
             show_index_stats(index)
         
@@ -550,28 +1413,45 @@ def main():
             show_index_stats(index)
             read_duration = prompt_int("Seconds to run read test", 30)
             read_threads = prompt_int("Number of read threads", DEFAULT_READ_THREADS)
-            run_read_load_test(index, read_duration, read_threads)
+            static_queries = prompt_static_queries()
+            cache_size = prompt_int("Query cache entries (0 = off)", 0)
+            index = index_for(read_threads)
+            run_read_load_test(index, read_duration, read_threads, static_queries, cache_size)
         
-        elif choice == 4:  # Aggressive multi-namespace query storm
+        elif choice == 4:  # Read only, asyncio
+            show_index_stats(index)
+            read_duration = prompt_int("Seconds to run read test", 30)
+            concurrency = prompt_int("Concurrent queries", DEFAULT_ASYNC_CONCURRENCY)
+            static_queries = prompt_static_queries()
+            run_async_read_load_test(api_key, pinecone_host, read_duration, concurrency, static_queries)
+        
+        elif choice == 5:  # Aggressive multi-namespace query storm
             show_index_stats(index)
             read_duration = prompt_int("Seconds to run storm", 60)
             threads_per_ns = prompt_int("Threads per namespace", DEFAULT_THREADS_PER_NAMESPACE)
             top_k = prompt_int("top_k per query", 10)
+            processes = prompt_int("Worker processes", default_storm_processes())
+            static_queries = prompt_static_queries()
             run_aggressive_multi_namespace_read_test(
-                index, read_duration, threads_per_ns, top_k
+                pc, pinecone_host, read_duration, threads_per_ns, top_k, processes, static_queries,
+                index_for,
             )
         
-        elif choice == 5:  # Delete
+        elif choice == 6:  # Delete
             if prompt_yes_no("Are you sure you want to delete ALL vectors?", default=False):
                 delete_all_vectors(index)
         
-        elif choice == 6:  # Stats
+        elif choice == 7:  # Stats
             show_index_stats(index)
         
-        elif choice == 7:  # Exit
+        elif choice == 8:  # Exit
             print("\nGoodbye!")
             break
 
 
 if __name__ == "__main__":
-    main()
+    listener = start_log_listener()
+    try:
+        main()
+    finally:
+        listener.stop()